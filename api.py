@@ -72,6 +72,8 @@ class ReplicateAPI:
         else:
             self.model = get_default_model()
 
+        self._is_edit_operation = False
+
     def edit_image(
         self,
         image: Gimp.Image,
@@ -106,6 +108,7 @@ class ReplicateAPI:
         if not image:
             return None, _("No GIMP image provided for editing")
 
+        self._is_edit_operation = True
         try:
             if (progress_callback and not progress_callback(
                 _("Preparing current image for Replicate..."),
@@ -178,6 +181,7 @@ class ReplicateAPI:
                 "Replicate API not available. Please install replicate"
             )
 
+        self._is_edit_operation = False
         try:
             with self._prepare_reference_images(
                 reference_images, self.model.max_reference_images
@@ -262,9 +266,9 @@ class ReplicateAPI:
 
         except ModelError as e:
             error_msg = _("Model error: {error}").format(error=str(e))
-            if hasattr(e, 'prediction') and e.prediction:
-                if hasattr(e.prediction, 'logs') and e.prediction.logs:
-                    error_msg += f"\n{_('Logs')}: {e.prediction.logs}"
+            logs = getattr(getattr(e, 'prediction', None), 'logs', None)
+            if logs:
+                error_msg += f"\n{_('Logs')}: {logs}"
             return error_msg
 
         except ReplicateError as e:
@@ -396,7 +400,7 @@ class ReplicateAPI:
         if progress_callback:
             operation_complete_msg = (
                 _("Image editing complete!")
-                if hasattr(self, '_is_edit_operation')
+                if self._is_edit_operation
                 else _("Image generation complete!")
             )
             progress_callback(operation_complete_msg, PROGRESS_COMPLETE)
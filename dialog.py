@@ -58,6 +58,8 @@ class DreamPrompterDialog(GimpUi.Dialog):
     def get_prompt(self):
         """Get the current prompt text"""
         if self.ui.prompt_buffer:
+            if not self.ui.prompt_buffer.get_char_count():
+                return ""
             start_iter = self.ui.prompt_buffer.get_start_iter()
             end_iter = self.ui.prompt_buffer.get_end_iter()
             return self.ui.prompt_buffer.get_text(
@@ -25,6 +25,7 @@ class DreamPrompterEventHandler:
         self.drawable = drawable
         self.ui.event_handler = self
         self.model = get_default_model()
+        self._applied_model_name = None
 
         self.threads = DreamPrompterThreads(ui, image, drawable)
         self.threads.set_callbacks({
@@ -54,15 +55,15 @@ class DreamPrompterEventHandler:
 
     def connect_all_signals(self):
         """Connect all UI signals to handlers"""
+        self.dialog.connect("destroy", self.on_destroy)
+
         if self.ui.model_dropdown:
             self.ui.model_dropdown.connect('changed', self.on_model_changed)
 
+        # Both radios share a group, so the edit radio toggles on every
+        # mode switch and one handler covers both buttons
         if self.ui.edit_mode_radio:
             self.ui.edit_mode_radio.connect("toggled", self.on_mode_changed)
-        if self.ui.generate_mode_radio:
-            self.ui.generate_mode_radio.connect(
-                "toggled", self.on_mode_changed
-            )
 
         if self.ui.toggle_visibility_btn:
             self.ui.toggle_visibility_btn.connect(
@@ -100,6 +101,10 @@ class DreamPrompterEventHandler:
         self.ui.selected_files.clear()
         self.ui.update_files_display()
 
+    def on_destroy(self, _dialog):
+        """Stop the background worker when the dialog goes away"""
+        self.threads.shutdown()
+
     def on_generate(self, _button):
         """Handle generate button - main AI processing entry point"""
         api_key = self.dialog.get_api_key()
@@ -142,9 +147,13 @@ class DreamPrompterEventHandler:
     def on_model_changed(self, combo_box):
         """Handle model selection changes"""
         selected_model_name = combo_box.get_active_id()
+        if selected_model_name == self._applied_model_name:
+            return
+
         if selected_model_name:
             new_model = get_model_by_name(selected_model_name)
             if new_model:
+                self._applied_model_name = selected_model_name
                 self.model = new_model
                 self.update_ui_limits()
                 self.ui.update_model_description(new_model)
@@ -242,23 +251,7 @@ class DreamPrompterEventHandler:
 
     def on_toggle_visibility(self, button):
         """Handle API key visibility toggle"""
-        if not self.ui.api_key_entry:
-            return
-
-        if button.get_active():
-            self.ui.api_key_entry.set_visibility(True)
-            icon = Gtk.Image.new_from_icon_name(
-                "view-reveal-symbolic", Gtk.IconSize.BUTTON
-            )
-            button.set_image(icon)
-            button.set_tooltip_text(_("Hide API key"))
-        else:
-            self.ui.api_key_entry.set_visibility(False)
-            icon = Gtk.Image.new_from_icon_name(
-                "view-conceal-symbolic", Gtk.IconSize.BUTTON
-            )
-            button.set_image(icon)
-            button.set_tooltip_text(_("Show API key"))
+        self.ui.toggle_api_key_visibility(button)
 
     def show_error(self, message):
         """Show error message and enable interface"""
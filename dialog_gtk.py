@@ -7,24 +7,103 @@ Handles all GTK interface creation and layout
 """
 
 import os
+import sys
+from typing import cast
 
-from gi.repository import Gtk, Pango
+from gi.repository import GLib, Gtk, Pango
 
 from i18n import _
 from models import ParameterType
-from models.factory import get_model_by_name, get_models_for_context
+from models.factory import get_model_by_name, get_model_options_for_context
 from model_settings import ModelParameterManager
 
+ALIGN_START = Gtk.Align.START
+API_KEY_HELP_URL = "https://replicate.com/account/api-tokens"
+COMBO_TEXT_COLUMN = 0
+COMBO_ID_COLUMN = 1
+COMBO_TEXT_ID_COLUMNS = [COMBO_TEXT_COLUMN, COMBO_ID_COLUMN]
+ELLIPSIZE_END = Pango.EllipsizeMode.END
+FILE_ROW_CSS = b".dream-prompter-file-row { margin: 3px 6px; }"
+HORIZONTAL = Gtk.Orientation.HORIZONTAL
+ICON_SIZE_BUTTON = Gtk.IconSize.BUTTON
+NUMERIC_PARAMETER_TYPES = frozenset(
+    (ParameterType.INTEGER, ParameterType.FLOAT)
+)
+SPIN_BUTTON_DEFAULTS = {
+    ParameterType.FLOAT: (0.0, 100.0, 0.1, 2),
+    ParameterType.INTEGER: (0, 10000, 1, 0),
+}
+VERTICAL = Gtk.Orientation.VERTICAL
+
+TEXT_API_KEY_PLACEHOLDER = _("Enter your Replicate API key")
+TEXT_API_KEY_VISIBILITY_TOOLTIP = _("Show/Hide API key")
+TEXT_CANCEL = _("Cancel")
+TEXT_CLEAR_FILES_TOOLTIP = _("Clear selected files")
+TEXT_EDIT_IMAGE = _("Edit Image")
+TEXT_FILE_SIZE_EXCEEDED = _("⚠️ ({size:.1f} MB - Max Size Exceeded)")
+TEXT_FILE_SIZE_KB = _("({size:.0f} KB)")
+TEXT_FILE_SIZE_MB = _("({size:.1f} MB)")
+TEXT_FILES_SELECTED_MANY = _("{count} images selected")
+TEXT_FILES_SELECTED_ONE = _("{count} image selected")
+TEXT_GENERATE_EDIT = _("Generate Edit")
+TEXT_GENERATE_IMAGE = _("Generate Image")
+TEXT_HIDE_API_KEY = _("Hide API key")
+TEXT_NO_FILES_SELECTED = _("No additional images selected")
+TEXT_READY = _("Ready")
+TEXT_SELECT_IMAGES = _("Select Images...")
+TEXT_SHOW_API_KEY = _("Show API key")
+
+
+def _bold_markup(text):
+    """Escape a translated string and wrap it in bold markup"""
+    return f"<b>{GLib.markup_escape_text(text)}</b>"
+
+
+MARKUP_API_KEY_HELP = "<small>{}</small>".format(
+    _('Get your API key from <a href="{url}">Replicate</a>').format(
+        url=API_KEY_HELP_URL
+    )
+)
+MARKUP_TITLE_ADDITIONAL_IMAGES = _bold_markup(
+    _("Additional Images (Optional)")
+)
+MARKUP_TITLE_API_KEY = _bold_markup(_("Replicate API Key"))
+MARKUP_TITLE_MODEL = _bold_markup(_("AI Model"))
+MARKUP_TITLE_MODEL_SETTINGS = _bold_markup(_("Model Settings"))
+MARKUP_TITLE_MODE = _bold_markup(_("Operation Mode"))
+MARKUP_TITLE_PROMPT = _bold_markup(_("AI Prompt"))
+
 
 class DreamPrompterUI:
     """Handles all GTK UI creation and layout"""
 
+    __slots__ = (
+        'selected_files', 'event_handler', 'has_image',
+        'api_key_entry', 'toggle_visibility_btn', '_conceal_icon',
+        '_reveal_icon', 'edit_mode_radio',
+        'generate_mode_radio', 'prompt_textview', 'prompt_buffer',
+        'file_chooser_btn', 'files_info_label', 'clear_files_btn',
+        'files_listbox', '_file_rows', '_display_names',
+        'images_help_label', 'cancel_btn', 'generate_btn', 'status_label',
+        'progress_bar', 'model_dropdown',
+        'model_description_label', 'model_settings_section',
+        'model_settings_stack', 'model_settings_widgets', '_settings_pages',
+        '_parameter_managers', '_choice_stores', '_label_size_group',
+        '_settings_ui_ready', '_pending_settings_update',
+        '_settings_update_scheduled', '_parameter_widget_builders',
+        '_controlled_widgets', '_selected_model_name', '_last_status',
+        '_applied_settings_key',
+    )
+
     def __init__(self):
         self.selected_files = []
         self.event_handler = None
+        self.has_image = False
 
         self.api_key_entry = None
         self.toggle_visibility_btn = None
+        self._conceal_icon = None
+        self._reveal_icon = None
         self.edit_mode_radio = None
         self.generate_mode_radio = None
         self.prompt_textview = None
@@ -33,15 +112,38 @@ class DreamPrompterUI:
         self.files_info_label = None
         self.clear_files_btn = None
         self.files_listbox = None
+        self._file_rows = []
+        self._display_names = {}
         self.images_help_label = None
         self.cancel_btn = None
         self.generate_btn = None
         self.status_label = None
         self.progress_bar = None
+        self._last_status = None
+        self._controlled_widgets = ()
         self.model_dropdown = None
+        self._selected_model_name = None
         self.model_description_label = None
         self.model_settings_section = None
+        self.model_settings_stack = None
         self.model_settings_widgets = {}
+        self._settings_pages = {}
+        self._parameter_managers = {}
+        self._choice_stores = {}
+        self._label_size_group = Gtk.SizeGroup(
+            mode=Gtk.SizeGroupMode.HORIZONTAL
+        )
+        self._settings_ui_ready = False
+        self._pending_settings_update = None
+        self._settings_update_scheduled = False
+        self._applied_settings_key = None
+        self._parameter_widget_builders = {
+            ParameterType.BOOLEAN: self._create_boolean_widget,
+            ParameterType.CHOICE: self._create_choice_widget,
+            ParameterType.FLOAT: self._create_spin_widget,
+            ParameterType.INTEGER: self._create_spin_widget,
+            ParameterType.STRING: self._create_string_widget,
+        }
 
     def build_interface(self, parent_dialog):
         """Build the main plugin interface with two-column layout"""
@@ -50,18 +152,20 @@ class DreamPrompterUI:
 
         has_image = bool(parent_dialog.image and parent_dialog.drawable)
         self.set_has_image(has_image)
+        self._install_css(parent_dialog.get_screen())
+        parent_dialog.connect("map", self._on_dialog_map)
 
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
+        main_box = Gtk.Box(orientation=VERTICAL, spacing=16)
         main_box.set_margin_top(16)
         main_box.set_margin_bottom(16)
         main_box.set_margin_start(16)
         main_box.set_margin_end(16)
 
         try:
-            columns_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=16)
+            columns_box = Gtk.Box(orientation=HORIZONTAL, spacing=16)
             columns_box.set_homogeneous(True)
 
-            left_column = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
+            left_column = Gtk.Box(orientation=VERTICAL, spacing=16)
             left_column.set_size_request(300, -1)
 
             api_key_section = self._create_api_key_section()
@@ -78,7 +182,7 @@ class DreamPrompterUI:
 
             columns_box.pack_start(left_column, True, True, 0)
 
-            right_column = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
+            right_column = Gtk.Box(orientation=VERTICAL, spacing=16)
             right_column.set_size_request(300, -1)
 
             model_settings_section = self._create_model_settings_section()
@@ -97,45 +201,59 @@ class DreamPrompterUI:
             status_section = self._create_status_section()
             main_box.pack_start(status_section, False, False, 0)
 
+            self._controlled_widgets = tuple(
+                widget for widget in (
+                    self.api_key_entry, self.toggle_visibility_btn,
+                    self.model_dropdown, self.edit_mode_radio,
+                    self.generate_mode_radio, self.prompt_textview,
+                    self.file_chooser_btn, self.clear_files_btn,
+                    self.generate_btn,
+                ) if widget
+            )
+
             parent_dialog.get_content_area().add(main_box)
         except Exception as e:
             print(f"Error building interface: {e}")
 
     def get_selected_model(self):
         """Get the currently selected model name"""
-        if self.model_dropdown:
-            return self.model_dropdown.get_active_id()
-        return None
+        return self._selected_model_name
 
     def hide_progress(self):
         """Hide progress bar and show status message"""
         if self.progress_bar:
             self.progress_bar.set_visible(False)
         if self.status_label:
-            self.status_label.set_text(_("Ready"))
+            self.status_label.set_text(TEXT_READY)
+        self._last_status = None
 
     def refresh_model_dropdown(self):
-        """Refresh the model dropdown with context-appropriate models"""
+        """
+        Refresh the model dropdown with context-appropriate models
+
+        The model change handler is blocked while the list is rebuilt, so
+        it runs once for the final selection instead of for the transient
+        empty selection.
+        """
         if not self.model_dropdown:
             return
 
         current_model = self.get_selected_model()
+        model_options = get_model_options_for_context(self.has_image)
 
-        self.model_dropdown.remove_all()
-
-        available_models = get_models_for_context(self.has_image)
-        sorted_models = sorted(
-          available_models.items(),
-          key=lambda x: x[1].display_name
-        )
-
-        for model_name, model in sorted_models:
-            display_text = f"{model.display_name}"
-            self.model_dropdown.append(model_name, display_text)
-
-        if current_model and current_model in available_models:
-            self.set_selected_model(current_model)
-        else:
+        handler = (self.event_handler.on_model_changed
+                   if self.event_handler else None)
+        if handler:
+            self.model_dropdown.handler_block_by_func(handler)
+        try:
+            store = cast(Gtk.ListStore, self.model_dropdown.get_model())
+            store.clear()
+            self._fill_list_store(store, model_options)
+        finally:
+            if handler:
+                self.model_dropdown.handler_unblock_by_func(handler)
+
+        if not current_model or not self.set_selected_model(current_model):
             tree_model = self.model_dropdown.get_model()
             if tree_model and len(tree_model) > 0:
                 self.model_dropdown.set_active(0)
@@ -145,46 +263,51 @@ class DreamPrompterUI:
         self.has_image = has_image
 
     def set_selected_model(self, model_name):
-        """Set the selected model"""
-        if self.model_dropdown and model_name:
-            self.model_dropdown.set_active_id(model_name)
-            model = get_model_by_name(model_name)
-            if model:
-                self.update_model_description(model)
-                self.update_model_settings_ui(model)
+        """
+        Set the selected model
+
+        When the selection changes, the dropdown's changed handler applies
+        the new model, so it is only applied here when no handler will run.
+
+        Args:
+            model_name: Name of the model to select
+
+        Returns:
+            True if the model is listed in the dropdown and was selected
+        """
+        if not self.model_dropdown or not model_name:
+            return False
+
+        previous_model = self.model_dropdown.get_active_id()
+        if not self.model_dropdown.set_active_id(model_name):
+            return False
+        if self.event_handler and previous_model != model_name:
+            return True
+
+        model = get_model_by_name(model_name)
+        if model:
+            self.update_model_description(model)
+            self.update_model_settings_ui(model)
+        return True
 
     def set_ui_enabled(self, enabled=True):
         """Enable/disable UI controls"""
-        if self.api_key_entry:
-            self.api_key_entry.set_sensitive(enabled)
-        if self.toggle_visibility_btn:
-            self.toggle_visibility_btn.set_sensitive(enabled)
-        if self.model_dropdown:
-            self.model_dropdown.set_sensitive(enabled)
-        if self.edit_mode_radio:
-            self.edit_mode_radio.set_sensitive(enabled)
-        if self.generate_mode_radio:
-            self.generate_mode_radio.set_sensitive(enabled)
-        if self.prompt_textview:
-            self.prompt_textview.set_sensitive(enabled)
-        if self.file_chooser_btn:
-            self.file_chooser_btn.set_sensitive(enabled)
-        if self.clear_files_btn:
-            self.clear_files_btn.set_sensitive(enabled)
-        if self.generate_btn:
-            self.generate_btn.set_sensitive(enabled)
+        for widget in self._controlled_widgets:
+            widget.set_sensitive(enabled)
 
     def toggle_api_key_visibility(self, button):
         """Toggle API key visibility and update button icon"""
         if not self.api_key_entry:
             return
 
-        is_visible = button.get_active()
-        self.api_key_entry.set_visibility(is_visible)
-
-        icon_name = ("view-reveal-symbolic" if is_visible
-                     else "view-conceal-symbolic")
-        button.get_image().set_from_icon_name(icon_name, Gtk.IconSize.BUTTON)
+        if button.get_active():
+            self.api_key_entry.set_visibility(True)
+            button.set_image(self._reveal_icon)
+            button.set_tooltip_text(TEXT_HIDE_API_KEY)
+        else:
+            self.api_key_entry.set_visibility(False)
+            button.set_image(self._conceal_icon)
+            button.set_tooltip_text(TEXT_SHOW_API_KEY)
 
     def update_files_display(self):
         """Update the files display"""
@@ -219,118 +342,178 @@ class DreamPrompterUI:
             self.model_description_label.set_markup(markup)
 
     def update_model_settings_ui(self, model, current_mode=None):
-        """Update the model settings UI for the selected model"""
+        """
+        Update the model settings UI for the selected model
+
+        The update runs from an idle callback, so several model and mode
+        changes in one main loop iteration result in a single update for
+        the last request. Requests made before the dialog is mapped wait
+        until it is.
+        """
+        if not self.model_settings_section:
+            return
+
+        self._pending_settings_update = (model, current_mode)
+        if self._settings_ui_ready and not self._settings_update_scheduled:
+            self._settings_update_scheduled = True
+            GLib.idle_add(self._flush_model_settings_ui)
+
+    def update_status(self, message, percentage=None):
+        """
+        Update status display
+
+        Repeating the last message and percentage is a no-op, except that
+        an update without a percentage always pulses the progress bar.
+        """
+        status = (message, percentage)
+        if status == self._last_status and percentage is not None:
+            return
+
+        self._last_status = status
+
+        if self.status_label:
+            self.status_label.set_text(message)
+
+        if percentage is not None:
+            if self.progress_bar:
+                self.progress_bar.set_fraction(percentage)
+                self.progress_bar.set_visible(True)
+        else:
+            if self.progress_bar:
+                self.progress_bar.pulse()
+                self.progress_bar.set_visible(True)
+
+    def _apply_model_settings_ui(self, model, current_mode):
+        """
+        Show the settings page for a model in the given mode
+
+        Each model's settings page is built once, added to the settings
+        stack and brought to the front when the model is selected again.
+        Switching modes only changes which parameter rows are visible,
+        and nothing is done when the model and mode are already shown.
+        """
         if not self.model_settings_section:
             return
 
         if current_mode is None and self.event_handler:
             current_mode = self.event_handler.dialog.get_current_mode()
 
-        for child in self.model_settings_section.get_children():
-            self.model_settings_section.remove(child)
-        self.model_settings_widgets.clear()
+        settings_key = (model.name if model else None, current_mode)
+        if settings_key == self._applied_settings_key:
+            return
+        self._applied_settings_key = settings_key
 
-        if not model:
+        self.model_settings_widgets = {}
+
+        if not model or not self.model_settings_stack:
             self.model_settings_section.hide()
             return
 
-        param_definitions = model.get_parameter_definitions()
-        if not param_definitions:
+        page = self._settings_pages.get(model.name)
+        if page is None:
+            page = self._create_model_settings_page(model)
+            self._settings_pages[model.name] = page
+            if page[0]:
+                self.model_settings_stack.add_named(page[0], model.name)
+
+        container, rows, widgets = page
+        self.model_settings_widgets = widgets
+        if not container:
             self.model_settings_section.set_visible(False)
             return
 
-        filtered_params = []
-        if current_mode:
-            for param_def in param_definitions:
-                if param_def.supports_mode(current_mode):
-                    filtered_params.append(param_def)
-        else:
-            filtered_params = param_definitions
+        has_visible_rows = False
+        for param_def, cells in rows:
+            visible = (not current_mode
+                       or param_def.supports_mode(current_mode))
+            for cell in cells:
+                cell.set_visible(visible)
+            has_visible_rows = has_visible_rows or visible
 
-        if not filtered_params:
+        if not has_visible_rows:
             self.model_settings_section.set_visible(False)
             return
 
-        title_label = Gtk.Label()
-        title_label.set_markup(f"<b>{_('Model Settings')}</b>")
-        title_label.set_halign(Gtk.Align.START)
-        self.model_settings_section.pack_start(title_label, False, False, 0)
+        self.model_settings_stack.set_visible_child_name(model.name)
+        self.model_settings_section.set_visible(True)
 
-        try:
-            manager = ModelParameterManager(model.name)
-            current_values = manager.get_all_parameter_values()
-        except Exception as e:
-            print(f"Error loading model settings: {e}")
-            current_values = {}
+    def _attach_parameter_row(self, grid, row_index, param_def,
+                              current_value):
+        """
+        Attach the label and input widget for a parameter to a grid row
 
-        for param_def in filtered_params:
-            param_name = param_def.name
-            current_value = current_values.get(param_name)
-            param_container = self._create_parameter_widget(
-                param_def, current_value
-            )
-            if param_container:
-                self.model_settings_section.pack_start(
-                    param_container, False, False, 0
-                )
+        Args:
+            grid: Gtk.Grid holding the settings rows
+            row_index: Grid row to attach to
+            param_def: Parameter to create the row for
+            current_value: Stored value, or None for the default
 
-        self.model_settings_section.set_visible(True)
-        self.model_settings_section.show_all()
+        Returns:
+            Tuple of the widgets attached to the row
+        """
+        label = Gtk.Label()
+        label.set_text(param_def.label + ":")
+        label.set_halign(ALIGN_START)
+        label.set_xalign(0.0)
+        self._label_size_group.add_widget(label)
+        grid.attach(label, 0, row_index, 1, 1)
 
-    def update_status(self, message, percentage=None):
-        """Update status display"""
-        if self.status_label:
-            self.status_label.set_text(message)
+        builder = self._parameter_widget_builders.get(param_def.param_type)
+        widget = builder(param_def, current_value) if builder else None
+        if not widget:
+            return (label,)
 
-        if percentage is not None:
-            if self.progress_bar:
-                self.progress_bar.set_fraction(percentage)
-                self.progress_bar.set_visible(True)
-        else:
-            if self.progress_bar:
-                self.progress_bar.pulse()
-                self.progress_bar.set_visible(True)
+        widget.set_hexpand(True)
+        grid.attach(widget, 1, row_index, 1, 1)
+        self.model_settings_widgets[param_def.name] = widget
+
+        if param_def.description:
+            widget.set_tooltip_text(param_def.description)
+            label.set_tooltip_text(param_def.description)
+
+        return label, widget
 
     def _clear_existing_file_rows(self):
         """Clear existing file rows from the listbox"""
         if self.files_listbox:
-            for child in self.files_listbox.get_children():
-                self.files_listbox.remove(child)
+            self.files_listbox.freeze_child_notify()
+            try:
+                for child in self.files_listbox.get_children():
+                    self.files_listbox.remove(child)
+            finally:
+                self.files_listbox.thaw_child_notify()
+        self._file_rows = []
 
     def _create_additional_images_section(self):
         """Create additional images selection section"""
-        section_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
+        section_box = Gtk.Box(orientation=VERTICAL, spacing=8)
 
         title_label = Gtk.Label()
-        title_label.set_markup(
-            f"<b>{_('Additional Images (Optional)')}</b>"
-        )
-        title_label.set_halign(Gtk.Align.START)
+        title_label.set_markup(MARKUP_TITLE_ADDITIONAL_IMAGES)
+        title_label.set_halign(ALIGN_START)
         section_box.pack_start(title_label, False, False, 0)
 
-        files_container = Gtk.Box(
-            orientation=Gtk.Orientation.HORIZONTAL, spacing=8
-        )
+        files_container = Gtk.Box(orientation=HORIZONTAL, spacing=8)
 
         self.file_chooser_btn = Gtk.Button()
-        self.file_chooser_btn.set_label(_("Select Images..."))
+        self.file_chooser_btn.set_label(TEXT_SELECT_IMAGES)
         icon = Gtk.Image.new_from_icon_name("document-open-symbolic",
-                                            Gtk.IconSize.BUTTON)
+                                            ICON_SIZE_BUTTON)
         self.file_chooser_btn.set_image(icon)
         files_container.pack_start(self.file_chooser_btn, False, False, 0)
 
         self.files_info_label = Gtk.Label()
-        self.files_info_label.set_text(_("No additional images selected"))
-        self.files_info_label.set_halign(Gtk.Align.START)
+        self.files_info_label.set_text(TEXT_NO_FILES_SELECTED)
+        self.files_info_label.set_halign(ALIGN_START)
         style_context = self.files_info_label.get_style_context()
         style_context.add_class("dim-label")
         files_container.pack_start(self.files_info_label, True, True, 0)
 
         self.clear_files_btn = Gtk.Button()
         clear_icon = Gtk.Image.new_from_icon_name("edit-clear-symbolic",
-                                                  Gtk.IconSize.BUTTON)
+                                                  ICON_SIZE_BUTTON)
         self.clear_files_btn.set_image(clear_icon)
-        self.clear_files_btn.set_tooltip_text(_("Clear selected files"))
+        self.clear_files_btn.set_tooltip_text(TEXT_CLEAR_FILES_TOOLTIP)
         self.clear_files_btn.set_sensitive(False)
         files_container.pack_start(self.clear_files_btn, False, False, 0)
 
@@ -340,10 +523,11 @@ class DreamPrompterUI:
         self.files_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
         self.files_listbox.get_style_context().add_class("content")
         self.files_listbox.set_visible(False)
+        self.files_listbox.set_no_show_all(True)
         section_box.pack_start(self.files_listbox, False, False, 0)
 
         self.images_help_label = Gtk.Label()
-        self.images_help_label.set_halign(Gtk.Align.START)
+        self.images_help_label.set_halign(ALIGN_START)
         self.images_help_label.set_line_wrap(True)
         section_box.pack_start(self.images_help_label, False, False, 0)
 
@@ -351,63 +535,72 @@ class DreamPrompterUI:
 
     def _create_api_key_section(self):
         """Create API key input section"""
-        section_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
+        section_box = Gtk.Box(orientation=VERTICAL, spacing=8)
 
-        title_label = Gtk.Label()
-        title_label.set_markup(f"<b>{_('Replicate API Key')}</b>")
-        title_label.set_halign(Gtk.Align.START)
+        title_label = Gtk.Label(
+            label=MARKUP_TITLE_API_KEY, use_markup=True, halign=ALIGN_START
+        )
         section_box.pack_start(title_label, False, False, 0)
 
-        key_container = Gtk.Box(
-            orientation=Gtk.Orientation.HORIZONTAL, spacing=8
-        )
+        key_container = Gtk.Box(orientation=HORIZONTAL, spacing=8)
 
-        self.api_key_entry = Gtk.Entry()
-        placeholder = _("Enter your Replicate API key")
-        self.api_key_entry.set_placeholder_text(placeholder)
-        self.api_key_entry.set_visibility(False)
-        self.api_key_entry.set_input_purpose(Gtk.InputPurpose.PASSWORD)
+        self.api_key_entry = Gtk.Entry(
+            placeholder_text=TEXT_API_KEY_PLACEHOLDER,
+            visibility=False,
+            input_purpose=Gtk.InputPurpose.PASSWORD
+        )
         key_container.pack_start(self.api_key_entry, True, True, 0)
 
-        self.toggle_visibility_btn = Gtk.ToggleButton()
-        self.toggle_visibility_btn.set_image(
-            Gtk.Image.new_from_icon_name(
-                "view-conceal-symbolic", Gtk.IconSize.BUTTON
-            )
+        self._conceal_icon = Gtk.Image.new_from_icon_name(
+            "view-conceal-symbolic", ICON_SIZE_BUTTON
+        )
+        self._reveal_icon = Gtk.Image.new_from_icon_name(
+            "view-reveal-symbolic", ICON_SIZE_BUTTON
+        )
+        self.toggle_visibility_btn = Gtk.ToggleButton(
+            image=self._conceal_icon,
+            tooltip_text=TEXT_API_KEY_VISIBILITY_TOOLTIP
         )
-        tooltip_text = _("Show/Hide API key")
-        self.toggle_visibility_btn.set_tooltip_text(tooltip_text)
         key_container.pack_start(self.toggle_visibility_btn, False, False, 0)
 
         section_box.pack_start(key_container, False, False, 0)
 
-        help_label = Gtk.Label()
-        help_url = "https://replicate.com/account/api-tokens"
-        help_text = _('Get your API key from <a href="{url}">Replicate</a>')
-        help_text = help_text.format(url=help_url)
-        help_label.set_markup(f'<small>{help_text}</small>')
-        help_label.set_halign(Gtk.Align.START)
-        help_label.set_line_wrap(True)
+        help_label = Gtk.Label(
+            label=MARKUP_API_KEY_HELP, use_markup=True, halign=ALIGN_START,
+            wrap=True
+        )
         section_box.pack_start(help_label, False, False, 0)
 
         return section_box
 
+    def _create_boolean_widget(self, param_def, current_value):
+        """Create a check button for a boolean parameter"""
+        widget = Gtk.CheckButton()
+        default_val = param_def.default_value
+        value = (bool(current_value) if current_value is not None
+                 else default_val)
+        widget.set_active(value)
+        widget.connect(
+            'toggled', self._on_parameter_changed, param_def
+        )
+        return widget
+
     def _create_buttons_section(self):
         """Create action buttons section"""
         buttons_box = Gtk.Box(
-            orientation=Gtk.Orientation.HORIZONTAL, spacing=12
+            orientation=HORIZONTAL, spacing=12
         )
         buttons_box.set_halign(Gtk.Align.CENTER)
 
         self.cancel_btn = Gtk.Button()
-        self.cancel_btn.set_label(_("Cancel"))
+        self.cancel_btn.set_label(TEXT_CANCEL)
         self.cancel_btn.set_size_request(100, -1)
         buttons_box.pack_start(self.cancel_btn, False, False, 0)
 
         self.generate_btn = Gtk.Button()
-        self.generate_btn.set_label(_("Generate Edit"))
+        self.generate_btn.set_label(TEXT_GENERATE_EDIT)
         gen_icon = Gtk.Image.new_from_icon_name(
-            "applications-graphics-symbolic", Gtk.IconSize.BUTTON
+            "applications-graphics-symbolic", ICON_SIZE_BUTTON
         )
         self.generate_btn.set_image(gen_icon)
         generate_style = self.generate_btn.get_style_context()
@@ -417,14 +610,26 @@ class DreamPrompterUI:
 
         return buttons_box
 
+    def _create_choice_widget(self, param_def, current_value):
+        """Create a combo box for a choice parameter"""
+        store = self._get_choice_store(param_def.choices)
+        widget = Gtk.ComboBox.new_with_model(store)
+        widget.set_id_column(COMBO_ID_COLUMN)
+        renderer = Gtk.CellRendererText()
+        widget.pack_start(renderer, True)
+        widget.add_attribute(renderer, "text", COMBO_TEXT_COLUMN)
+
+        if current_value is not None:
+            widget.set_active_id(str(current_value))
+        else:
+            widget.set_active_id(str(param_def.default_value))
+        widget.connect('changed', self._on_parameter_changed, param_def)
+        return widget
+
     def _create_file_box(self, filename, file_path):
         """Create the horizontal box for a file entry"""
-        orientation = Gtk.Orientation.HORIZONTAL
-        file_box = Gtk.Box(orientation=orientation, spacing=8)
-        file_box.set_margin_top(3)
-        file_box.set_margin_bottom(3)
-        file_box.set_margin_start(6)
-        file_box.set_margin_end(6)
+        file_box = Gtk.Box(orientation=HORIZONTAL, spacing=8)
+        file_box.get_style_context().add_class("dream-prompter-file-row")
 
         icon = Gtk.Image.new_from_icon_name("image-x-generic-symbolic",
                                             Gtk.IconSize.SMALL_TOOLBAR)
@@ -432,8 +637,8 @@ class DreamPrompterUI:
 
         label = Gtk.Label()
         label.set_text(filename)
-        label.set_halign(Gtk.Align.START)
-        label.set_ellipsize(Pango.EllipsizeMode.END)
+        label.set_halign(ALIGN_START)
+        label.set_ellipsize(ELLIPSIZE_END)
         file_box.pack_start(label, True, True, 0)
 
         remove_btn = self._create_remove_button(file_path)
@@ -441,40 +646,25 @@ class DreamPrompterUI:
 
         return file_box
 
-    def _create_file_rows(self):
-        """Create rows for each selected file"""
-        if not self.files_listbox:
-            return
-
-        for file_path in self.selected_files:
-            row = self._create_single_file_row(file_path)
-            self.files_listbox.add(row)
-
     def _create_model_selection_section(self):
         """Create AI model selection section"""
-        section_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
+        section_box = Gtk.Box(orientation=VERTICAL, spacing=8)
 
         title_label = Gtk.Label()
-        title_label.set_markup(f"<b>{_('AI Model')}</b>")
-        title_label.set_halign(Gtk.Align.START)
+        title_label.set_markup(MARKUP_TITLE_MODEL)
+        title_label.set_halign(ALIGN_START)
         section_box.pack_start(title_label, False, False, 0)
 
         self.model_dropdown = Gtk.ComboBoxText()
 
-        available_models = get_models_for_context(self.has_image)
-        sorted_models = sorted(
-          available_models.items(),
-          key=lambda x: x[1].display_name
-        )
-
-        for model_name, model in sorted_models:
-            display_text = f"{model.display_name}"
-            self.model_dropdown.append(model_name, display_text)
+        model_options = get_model_options_for_context(self.has_image)
+        self._fill_list_store(self.model_dropdown.get_model(), model_options)
+        self.model_dropdown.connect('changed', self._on_model_dropdown_changed)
 
         section_box.pack_start(self.model_dropdown, False, False, 0)
 
         self.model_description_label = Gtk.Label()
-        self.model_description_label.set_halign(Gtk.Align.START)
+        self.model_description_label.set_halign(ALIGN_START)
         self.model_description_label.set_line_wrap(True)
         self.model_description_label.get_style_context().add_class("dim-label")
         section_box.pack_start(self.model_description_label, False, False, 0)
@@ -490,32 +680,88 @@ class DreamPrompterUI:
 
         return section_box
 
+    def _create_model_settings_page(self, model):
+        """
+        Build the settings page for a model
+
+        Args:
+            model: Model whose parameters the page edits
+
+        Returns:
+            Tuple of (page, [(param_def, row widgets), ...], widgets by
+            name); the page is None when the model has no parameters
+        """
+        self.model_settings_widgets = {}
+
+        param_definitions = model.get_parameter_definitions()
+        if not param_definitions:
+            return None, [], self.model_settings_widgets
+
+        page = Gtk.Box(orientation=VERTICAL, spacing=6)
+
+        title_label = Gtk.Label()
+        title_label.set_markup(MARKUP_TITLE_MODEL_SETTINGS)
+        title_label.set_halign(ALIGN_START)
+        page.pack_start(title_label, False, False, 0)
+
+        try:
+            manager = self._get_parameter_manager(model.name)
+            current_values = manager.get_all_parameter_values()
+        except Exception as e:
+            print(f"Error loading model settings: {e}")
+            current_values = {}
+
+        grid = Gtk.Grid(column_spacing=8, row_spacing=6)
+        page.pack_start(grid, False, False, 0)
+
+        rows = []
+        for row_index, param_def in enumerate(param_definitions):
+            current_value = current_values.get(param_def.name)
+            cells = self._attach_parameter_row(
+                grid, row_index, param_def, current_value
+            )
+            for cell in cells:
+                cell.show_all()
+                cell.set_no_show_all(True)
+            rows.append((param_def, cells))
+
+        title_label.show()
+        grid.show()
+        page.show()
+        return page, rows, self.model_settings_widgets
+
     def _create_model_settings_section(self):
         """Create model-specific settings section"""
-        orientation = Gtk.Orientation.VERTICAL
-        self.model_settings_section = Gtk.Box(
-            orientation=orientation, spacing=6
+        self.model_settings_section = Gtk.Box(orientation=VERTICAL,
+                                              spacing=6)
+        self.model_settings_section.set_no_show_all(True)
+
+        self.model_settings_stack = Gtk.Stack()
+        self.model_settings_stack.set_homogeneous(False)
+        self.model_settings_stack.show()
+        self.model_settings_section.pack_start(
+            self.model_settings_stack, False, False, 0
         )
         return self.model_settings_section
 
     def _create_mode_section(self):
         """Create mode selection section"""
-        section_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
+        section_box = Gtk.Box(orientation=VERTICAL, spacing=8)
 
         title_label = Gtk.Label()
-        title_label.set_markup(f"<b>{_('Operation Mode')}</b>")
-        title_label.set_halign(Gtk.Align.START)
+        title_label.set_markup(MARKUP_TITLE_MODE)
+        title_label.set_halign(ALIGN_START)
         section_box.pack_start(title_label, False, False, 0)
 
-        radio_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=20)
+        radio_box = Gtk.Box(orientation=HORIZONTAL, spacing=20)
 
         self.edit_mode_radio = Gtk.RadioButton.new_with_label(
-            None, _("Edit Image")
+            None, TEXT_EDIT_IMAGE
         )
         radio_box.pack_start(self.edit_mode_radio, False, False, 0)
 
         self.generate_mode_radio = Gtk.RadioButton.new_with_label_from_widget(
-            self.edit_mode_radio, _("Generate Image")
+            self.edit_mode_radio, TEXT_GENERATE_IMAGE
         )
         radio_box.pack_start(self.generate_mode_radio, False, False, 0)
 
@@ -523,109 +769,13 @@ class DreamPrompterUI:
 
         return section_box
 
-    def _create_parameter_widget(self, param_def, current_value):
-        """Create a widget for a single parameter"""
-        container = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-
-        label = Gtk.Label()
-        label.set_text(param_def.label + ":")
-        label.set_halign(Gtk.Align.START)
-        label.set_xalign(0.0)
-        label.set_size_request(120, -1)
-        container.pack_start(label, False, False, 0)
-
-        widget = None
-
-        if param_def.param_type == ParameterType.CHOICE:
-            widget = Gtk.ComboBoxText()
-            for choice in param_def.choices:
-                widget.append(str(choice), str(choice))
-            if current_value is not None:
-                widget.set_active_id(str(current_value))
-            else:
-                widget.set_active_id(str(param_def.default_value))
-            widget.connect('changed', self._on_parameter_changed,
-                           param_def.name)
-
-        elif param_def.param_type == ParameterType.BOOLEAN:
-            widget = Gtk.CheckButton()
-            default_val = param_def.default_value
-            value = (bool(current_value) if current_value is not None
-                     else default_val)
-            widget.set_active(value)
-            widget.connect(
-                'toggled', self._on_parameter_changed, param_def.name
-            )
-
-        elif param_def.param_type == ParameterType.INTEGER:
-            min_val = (param_def.min_value if param_def.min_value is not None
-                       else 0)
-            max_val = (param_def.max_value if param_def.max_value is not None
-                       else 10000)
-            step = param_def.step if param_def.step is not None else 1
-
-            default_val = param_def.default_value
-            value = current_value if current_value is not None else default_val
-            adjustment = Gtk.Adjustment(
-                value=value,
-                lower=min_val,
-                upper=max_val,
-                step_increment=step,
-                page_increment=step * 10
-            )
-            widget = Gtk.SpinButton()
-            widget.set_adjustment(adjustment)
-            widget.set_digits(0)
-            widget.connect('value-changed',
-                           self._on_parameter_changed, param_def.name)
-
-        elif param_def.param_type == ParameterType.FLOAT:
-            min_val = (param_def.min_value if param_def.min_value is not None
-                       else 0.0)
-            max_val = (param_def.max_value if param_def.max_value is not None
-                       else 100.0)
-            step = param_def.step if param_def.step is not None else 0.1
-
-            default_val = param_def.default_value
-            value = current_value if current_value is not None else default_val
-            adjustment = Gtk.Adjustment(
-                value=value,
-                lower=min_val,
-                upper=max_val,
-                step_increment=step,
-                page_increment=step * 10
-            )
-            widget = Gtk.SpinButton()
-            widget.set_adjustment(adjustment)
-            widget.set_digits(2)
-            widget.connect('value-changed',
-                           self._on_parameter_changed, param_def.name)
-
-        elif param_def.param_type == ParameterType.STRING:
-            widget = Gtk.Entry()
-            text_value = (str(current_value) if current_value is not None
-                          else str(param_def.default_value))
-            widget.set_text(text_value)
-            widget.connect('changed', self._on_parameter_changed,
-                           param_def.name)
-
-        if widget:
-            container.pack_start(widget, True, True, 0)
-            self.model_settings_widgets[param_def.name] = widget
-
-            if param_def.description:
-                widget.set_tooltip_text(param_def.description)
-                label.set_tooltip_text(param_def.description)
-
-        return container
-
     def _create_prompt_section(self):
         """Create prompt input section"""
-        section_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
+        section_box = Gtk.Box(orientation=VERTICAL, spacing=8)
 
         title_label = Gtk.Label()
-        title_label.set_markup(f"<b>{_('AI Prompt')}</b>")
-        title_label.set_halign(Gtk.Align.START)
+        title_label.set_markup(MARKUP_TITLE_PROMPT)
+        title_label.set_halign(ALIGN_START)
         section_box.pack_start(title_label, False, False, 0)
 
         scroll_window = Gtk.ScrolledWindow()
@@ -668,71 +818,176 @@ class DreamPrompterUI:
 
     def _create_status_section(self):
         """Create status display section"""
-        section_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
+        section_box = Gtk.Box(orientation=VERTICAL, spacing=8)
 
         self.status_label = Gtk.Label()
-        self.status_label.set_text(_("Ready"))
-        self.status_label.set_halign(Gtk.Align.START)
+        self.status_label.set_text(TEXT_READY)
+        self.status_label.set_halign(ALIGN_START)
         self.status_label.get_style_context().add_class("dim-label")
         section_box.pack_start(self.status_label, False, False, 0)
 
         self.progress_bar = Gtk.ProgressBar()
         self.progress_bar.set_show_text(False)
         self.progress_bar.set_visible(False)
+        self.progress_bar.set_no_show_all(True)
         section_box.pack_start(self.progress_bar, False, False, 0)
 
         return section_box
 
+    def _create_spin_widget(self, param_def, current_value):
+        """Create a spin button for an integer or float parameter"""
+        min_val, max_val, step, digits = (
+            SPIN_BUTTON_DEFAULTS[param_def.param_type]
+        )
+        if param_def.min_value is not None:
+            min_val = param_def.min_value
+        if param_def.max_value is not None:
+            max_val = param_def.max_value
+        if param_def.step is not None:
+            step = param_def.step
+
+        default_val = param_def.default_value
+        value = current_value if current_value is not None else default_val
+        adjustment = Gtk.Adjustment(
+            value=value,
+            lower=min_val,
+            upper=max_val,
+            step_increment=step,
+            page_increment=step * 10
+        )
+        widget = Gtk.SpinButton()
+        widget.set_adjustment(adjustment)
+        widget.set_digits(digits)
+        widget.connect('value-changed',
+                       self._on_parameter_changed, param_def)
+        return widget
+
+    def _create_string_widget(self, param_def, current_value):
+        """Create a text entry for a string parameter"""
+        widget = Gtk.Entry()
+        text_value = (str(current_value) if current_value is not None
+                      else str(param_def.default_value))
+        widget.set_text(text_value)
+        widget.connect('changed', self._on_parameter_changed, param_def)
+        return widget
+
+    def _fill_list_store(self, store, items):
+        """
+        Fill a (text, id) ListStore from (id, text) pairs
+
+        Rows are inserted straight into the store, skipping the per-item
+        ComboBoxText.append wrapper.
+
+        Args:
+            store: Gtk.ListStore with text and id string columns
+            items: Iterable of (id, text) pairs
+        """
+        for item_id, text in items:
+            store.insert_with_valuesv(-1, COMBO_TEXT_ID_COLUMNS,
+                                      [text, item_id])
+
+    def _flush_model_settings_ui(self):
+        """Apply the latest pending settings UI update"""
+        self._settings_update_scheduled = False
+        pending = self._pending_settings_update
+        self._pending_settings_update = None
+        if pending:
+            self._apply_model_settings_ui(*pending)
+        return False
+
+    def _get_choice_store(self, choices):
+        """
+        Get the shared ListStore for a set of choices
+
+        Combos offering the same choices, such as the output format of
+        several models, share one store that is filled only once.
+        """
+        key = tuple(str(choice) for choice in choices)
+        store = self._choice_stores.get(key)
+        if store is None:
+            store = Gtk.ListStore(str, str)
+            self._fill_list_store(store, zip(key, key))
+            self._choice_stores[key] = store
+        return store
+
     def _get_display_filename(self, file_path):
         """Get filename with size info for display"""
         filename = os.path.basename(file_path)
 
         try:
-            file_size = os.path.getsize(file_path)
+            stat_result = os.stat(file_path)
+            signature = (stat_result.st_mtime_ns, stat_result.st_size)
+            cached = self._display_names.get(file_path)
+            if cached and cached[0] == signature:
+                return cached[1]
+
+            file_size = stat_result.st_size
             size_mb = file_size / (1024 * 1024)
 
             if size_mb > 7:
-                size_warning = _("⚠️ ({size:.1f} MB - Max Size Exceeded)")
-                filename += " " + size_warning.format(size=size_mb)
+                size_warning = TEXT_FILE_SIZE_EXCEEDED.format(size=size_mb)
+                filename += " " + size_warning
             elif size_mb >= 0.1:
-                size_text = _("({size:.1f} MB)").format(size=size_mb)
+                size_text = TEXT_FILE_SIZE_MB.format(size=size_mb)
                 filename += " " + size_text
             else:
                 size_kb = file_size / 1024
-                filename += " " + _("({size:.0f} KB)").format(size=size_kb)
+                filename += " " + TEXT_FILE_SIZE_KB.format(size=size_kb)
+
+            self._display_names[file_path] = (signature, filename)
         except Exception:
             pass
 
         return filename
 
-    def _on_parameter_changed(self, widget, param_name):
-        """Handle parameter value changes"""
+    def _get_parameter_manager(self, model_name):
+        """Get the cached parameter manager for a model, creating it once"""
+        manager = self._parameter_managers.get(model_name)
+        if manager is None:
+            manager = ModelParameterManager(model_name)
+            self._parameter_managers[model_name] = manager
+        return manager
+
+    def _install_css(self, screen):
+        """Register the plugin stylesheet for the dialog's screen"""
+        if not screen:
+            return
+
         try:
-            selected_model_name = self.get_selected_model()
-            if not selected_model_name:
-                return
+            provider = Gtk.CssProvider()
+            provider.load_from_data(FILE_ROW_CSS)
+            Gtk.StyleContext.add_provider_for_screen(
+                screen, provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
+        except Exception as e:
+            print(f"Error loading stylesheet: {e}")
 
-            model = get_model_by_name(selected_model_name)
-            if not model:
-                return
+    def _on_dialog_map(self, _dialog):
+        """Build the settings page requested before the dialog was shown"""
+        if self._settings_ui_ready:
+            return
 
-            manager = ModelParameterManager(selected_model_name)
+        self._settings_ui_ready = True
+        self._flush_model_settings_ui()
 
-            param_def = None
-            for p in model.get_parameter_definitions():
-                if p.name == param_name:
-                    param_def = p
-                    break
+    def _on_model_dropdown_changed(self, combo_box):
+        """Remember the selected model name for get_selected_model"""
+        model_name = combo_box.get_active_id()
+        self._selected_model_name = (sys.intern(model_name) if model_name
+                                     else None)
 
-            if not param_def:
+    def _on_parameter_changed(self, widget, param_def):
+        """Handle parameter value changes"""
+        try:
+            selected_model_name = self.get_selected_model()
+            if not selected_model_name:
                 return
 
             if param_def.param_type == ParameterType.CHOICE:
                 value = widget.get_active_id()
             elif param_def.param_type == ParameterType.BOOLEAN:
                 value = widget.get_active()
-            elif param_def.param_type in [ParameterType.INTEGER,
-                                          ParameterType.FLOAT]:
+            elif param_def.param_type in NUMERIC_PARAMETER_TYPES:
                 value = widget.get_value()
                 if param_def.param_type == ParameterType.INTEGER:
                     value = int(value)
@@ -741,23 +996,67 @@ class DreamPrompterUI:
             else:
                 return
 
-            manager.set_parameter_value(param_name, value)
+            manager = self._get_parameter_manager(selected_model_name)
+            manager.set_parameter_value(param_def.name, value)
 
         except Exception as e:
             print(f"Error handling parameter change: {e}")
 
+    def _reconcile_file_rows(self):
+        """
+        Bring the file rows in line with the selected files
+
+        Rows for files that are still selected are kept, rows for removed
+        files are dropped and only newly added files get a new row.
+        """
+        if not self.files_listbox:
+            return
+
+        reusable = {}
+        for file_path, row in self._file_rows:
+            reusable.setdefault(file_path, []).append(row)
+
+        new_rows = []
+        for file_path in self.selected_files:
+            rows = reusable.get(file_path)
+            if rows:
+                new_rows.append((file_path, rows.pop(0)))
+            else:
+                new_rows.append((file_path, None))
+
+        self.files_listbox.freeze_child_notify()
+        try:
+            for rows in reusable.values():
+                for row in rows:
+                    self.files_listbox.remove(row)
+
+            for index, (file_path, row) in enumerate(new_rows):
+                if row is None:
+                    row = self._create_single_file_row(file_path)
+                    row.show_all()
+                    new_rows[index] = (file_path, row)
+                elif row.get_index() == index:
+                    continue
+                else:
+                    self.files_listbox.remove(row)
+                self.files_listbox.insert(row, index)
+        finally:
+            self.files_listbox.thaw_child_notify()
+
+        self._file_rows = new_rows
+
     def _show_files_list(self):
         """Make the files list visible"""
         if self.files_listbox:
             self.files_listbox.set_visible(True)
-            self.files_listbox.show_all()
 
     def _update_empty_files_display(self):
         """Update display when no files are selected"""
         if self.files_info_label:
-            self.files_info_label.set_text(_("No additional images selected"))
+            self.files_info_label.set_text(TEXT_NO_FILES_SELECTED)
         if self.files_listbox:
             self.files_listbox.set_visible(False)
+        self._clear_existing_file_rows()
         if self.clear_files_btn:
             self.clear_files_btn.set_sensitive(False)
 
@@ -768,11 +1067,11 @@ class DreamPrompterUI:
 
         count = len(self.selected_files)
         if count == 1:
-            text = _("{count} image selected")
+            template = TEXT_FILES_SELECTED_ONE
         else:
-            text = _("{count} images selected").format(count=count)
+            template = TEXT_FILES_SELECTED_MANY
 
-        self.files_info_label.set_text(text)
+        self.files_info_label.set_text(template.format(count=count))
 
         if self.clear_files_btn:
             self.clear_files_btn.set_sensitive(True)
@@ -780,6 +1079,5 @@ class DreamPrompterUI:
     def _update_files_with_content(self):
         """Update display when files are selected"""
         self._update_files_info_label()
-        self._clear_existing_file_rows()
-        self._create_file_rows()
+        self._reconcile_file_rows()
         self._show_files_list()
@@ -6,8 +6,9 @@ Threading operations for Dream Prompter dialog
 Handles all background AI processing and image operations
 """
 
+import queue
 import threading
-from typing import Dict, Callable, Optional, Any, List
+from typing import Dict, Callable, Optional, Any, List, Tuple
 
 from gi.repository import GLib, GdkPixbuf
 
@@ -16,6 +17,11 @@ from api import ReplicateAPI
 from dialog_gtk import DreamPrompterUI
 from i18n import _
 
+ApiResult = Tuple[Optional[List[GdkPixbuf.Pixbuf]], Optional[str]]
+
+LAYER_NAME_PROMPT_LENGTH = 30
+STATUS_PERCENTAGE_STEP = 0.01
+
 
 class DreamPrompterThreads:
     """Handles all background threading operations"""
@@ -39,10 +45,18 @@ class DreamPrompterThreads:
         self.ui = ui
         self.image = image
         self.drawable = drawable
+        self._drawable_name: Optional[str] = None
         self._callbacks: Dict[str, Callable] = {}
         self._processing: bool = False
         self._cancel_requested: bool = False
-        self._current_thread: Optional[threading.Thread] = None
+        self._jobs: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._state_lock = threading.Lock()
+        self._status_lock = threading.Lock()
+        self._pending_status: Optional[Tuple[str, Optional[float]]] = None
+        self._last_status: Tuple[Optional[str], Optional[float]] = (
+            None, None
+        )
 
     def cancel_processing(self) -> None:
         """Request cancellation of current processing"""
@@ -76,6 +90,12 @@ class DreamPrompterThreads:
 
         self._callbacks = callbacks
 
+    def shutdown(self) -> None:
+        """Stop the background worker once any queued job has finished"""
+        if self._worker:
+            self._jobs.put(None)
+            self._worker = None
+
     def start_edit_thread(self, api_key: str, prompt: str,
                           reference_images: Optional[List[str]] = None,
                           model_name: Optional[str] = None) -> None:
@@ -95,7 +115,8 @@ class DreamPrompterThreads:
             self._handle_error(_("No layer available for editing"))
             return
 
-        if not self.image:
+        image = self.image
+        if not image:
             self._handle_error(_("No image available for editing"))
             return
 
@@ -107,16 +128,14 @@ class DreamPrompterThreads:
             self._handle_error(_("Prompt is required"))
             return
 
-        self._processing = True
-        self._cancel_requested = False
+        if not self._try_begin_processing():
+            return
+
+        self._drawable_name = self.drawable.get_name()
         self.ui.set_ui_enabled(False)
 
-        self._current_thread = threading.Thread(
-            target=self._edit_image_worker,
-            args=(api_key, prompt, reference_images, model_name)
-        )
-        self._current_thread.daemon = True
-        self._current_thread.start()
+        self._submit(self._edit_image_worker, image, api_key, prompt,
+                     reference_images, model_name)
 
     def start_generate_thread(self, api_key: str, prompt: str,
                               reference_images: Optional[List[str]] = None,
@@ -141,80 +160,55 @@ class DreamPrompterThreads:
             self._handle_error(_("Prompt is required"))
             return
 
-        self._processing = True
-        self._cancel_requested = False
+        if not self._try_begin_processing():
+            return
+
         self.ui.set_ui_enabled(False)
 
-        self._current_thread = threading.Thread(
-            target=self._generate_image_worker,
-            args=(api_key, prompt, reference_images, model_name)
-        )
-        self._current_thread.daemon = True
-        self._current_thread.start()
+        self._submit(self._generate_image_worker, api_key, prompt,
+                     reference_images, model_name)
 
-    def _edit_image_worker(self, api_key: str, prompt: str,
+    def _drain_status(self) -> bool:
+        """
+        Apply the most recent queued status update on the main thread
+
+        Returns:
+            False so the idle source is removed after one run
+        """
+        with self._status_lock:
+            status = self._pending_status
+            self._pending_status = None
+
+        if status:
+            self.ui.update_status(*status)
+        return False
+
+    def _edit_image_worker(self, image: Any, api_key: str, prompt: str,
                            reference_images: Optional[List[str]],
                            model_name: Optional[str]) -> None:
         """
         Edit image in background thread
 
         Args:
+            image: GIMP image to edit, checked by start_edit_thread
             api_key: Replicate API key
             prompt: Text prompt for image editing
             reference_images: List of reference image paths
             model_name: Optional model name to use
         """
-        try:
-            if self._cancel_requested:
-                GLib.idle_add(self._handle_cancelled)
-                return
-
-            if not self.image:
-                GLib.idle_add(
-                    self._handle_error, _("No image available for editing")
-                )
-                return
-
-            api = ReplicateAPI(api_key, model_name)
-
-            def progress_callback(message: str,
-                                  percentage: Optional[float] = None) -> bool:
-                """Progress callback for API operations"""
-                if self._cancel_requested:
-                    return False
-                GLib.idle_add(self.ui.update_status, message, percentage)
-                return True
-
-            pixbufs, error_msg = api.edit_image(
-                image=self.image,
+        def edit_image(api: ReplicateAPI) -> ApiResult:
+            return api.edit_image(
+                image=image,
                 prompt=prompt,
                 reference_images=reference_images,
-                progress_callback=progress_callback
+                progress_callback=self._report_progress
             )
 
-            if self._cancel_requested:
-                GLib.idle_add(self._handle_cancelled)
-                return
-
-            if error_msg:
-                GLib.idle_add(self._handle_error, error_msg)
-                return
-
-            if not pixbufs:
-                GLib.idle_add(
-                    self._handle_error, _("No image data received from API")
-                )
-                return
-
-            layer_name = self._generate_layer_name(prompt)
-            GLib.idle_add(self._handle_edited_images, pixbufs, layer_name)
-
-        except (ImportError, ValueError) as e:
-            GLib.idle_add(self._handle_error, str(e))
-        except Exception as e:
-            error_text = _("Unexpected error during image editing: {error}")
-            error_msg = error_text.format(error=str(e))
-            GLib.idle_add(self._handle_error, error_msg)
+        self._run_api_worker(
+            api_key, model_name, edit_image,
+            _("Unexpected error during image editing: {error}"),
+            self._handle_edited_images, prompt
+        )
 
     def _generate_image_worker(self, api_key: str, prompt: str,
                                reference_images: Optional[List[str]],
@@ -228,49 +222,18 @@ class DreamPrompterThreads:
             reference_images: List of reference image paths
             model_name: Optional model name to use
         """
-        try:
-            if self._cancel_requested:
-                GLib.idle_add(self._handle_cancelled)
-                return
-
-            api = ReplicateAPI(api_key, model_name)
-
-            def progress_callback(message: str,
-                                  percentage: Optional[float] = None) -> bool:
-                """Progress callback for API operations"""
-                if self._cancel_requested:
-                    return False
-                GLib.idle_add(self.ui.update_status, message, percentage)
-                return True
-
-            pixbufs, error_msg = api.generate_image(
+        def generate_image(api: ReplicateAPI) -> ApiResult:
+            return api.generate_image(
                 prompt=prompt,
                 reference_images=reference_images,
-                progress_callback=progress_callback
+                progress_callback=self._report_progress
             )
 
-            if self._cancel_requested:
-                GLib.idle_add(self._handle_cancelled)
-                return
-
-            if error_msg:
-                GLib.idle_add(self._handle_error, error_msg)
-                return
-
-            if not pixbufs:
-                GLib.idle_add(
-                    self._handle_error, _("No image data received from API")
-                )
-                return
-
-            GLib.idle_add(self._handle_generated_images, pixbufs, prompt)
-
-        except (ImportError, ValueError) as e:
-            GLib.idle_add(self._handle_error, str(e))
-        except Exception as e:
-            error_text = _("Unexpected error during image generation: {error}")
-            error_msg = error_text.format(error=str(e))
-            GLib.idle_add(self._handle_error, error_msg)
+        self._run_api_worker(
+            api_key, model_name, generate_image,
+            _("Unexpected error during image generation: {error}"),
+            self._handle_generated_images, prompt
+        )
 
     def _generate_layer_name(self, prompt: str) -> str:
         """
@@ -282,38 +245,37 @@ class DreamPrompterThreads:
         Returns:
             A descriptive name for the new layer
         """
-        if self.drawable and prompt:
-            original_name = self.drawable.get_name()
-            truncated_prompt = (prompt[:30] + "..." if len(prompt) > 30
-                                else prompt)
+        if not prompt:
+            return _("AI Layer")
+
+        truncated_prompt = (
+            prompt[:LAYER_NAME_PROMPT_LENGTH] + "..."
+            if len(prompt) > LAYER_NAME_PROMPT_LENGTH else prompt
+        )
+        if self._drawable_name is not None:
             return _("{original} (AI Edit: {prompt})").format(
-                original=original_name,
+                original=self._drawable_name,
                 prompt=truncated_prompt
             )
-        elif prompt:
-            truncated_prompt = (prompt[:30] + "..." if len(prompt) > 30
-                                else prompt)
-            return _("AI Generated: {prompt}").format(prompt=truncated_prompt)
-        else:
-            return _("AI Layer")
+        return _("AI Generated: {prompt}").format(prompt=truncated_prompt)
 
     def _handle_cancelled(self) -> None:
         """Handle cancelled operation"""
         self._processing = False
-        self._current_thread = None
         self.ui.hide_progress()
         self.ui.set_ui_enabled(True)
 
     def _handle_edited_images(self, pixbufs: List[GdkPixbuf.Pixbuf],
-                              base_layer_name: str) -> None:
+                              prompt: str) -> None:
         """
         Handle multiple edited images by creating layers
 
         Args:
             pixbufs: List of edited image data
-            base_layer_name: Base name for the new layers
+            prompt: The prompt used for editing, for the layer names
         """
         try:
+            base_layer_name = self._generate_layer_name(prompt)
             for i, pixbuf in enumerate(pixbufs):
                 if len(pixbufs) > 1:
                     layer_name = f"{base_layer_name} {i + 1}"
@@ -383,7 +345,6 @@ class DreamPrompterThreads:
             error_message: The error message to display
         """
         self._processing = False
-        self._current_thread = None
         self.ui.hide_progress()
         self.ui.set_ui_enabled(True)
 
@@ -393,9 +354,151 @@ class DreamPrompterThreads:
     def _handle_success(self) -> None:
         """Handle successful processing"""
         self._processing = False
-        self._current_thread = None
         self.ui.hide_progress()
         self.ui.set_ui_enabled(True)
 
         if self._callbacks.get('on_success'):
             self._callbacks['on_success']()
+
+    def _post_status(self, message: str,
+                     percentage: Optional[float]) -> None:
+        """
+        Queue a status update from the worker thread
+
+        Updates that repeat the last message with a progress change below
+        STATUS_PERCENTAGE_STEP are dropped. Of the rest, only the latest is
+        kept, and a single idle callback is scheduled until it has been
+        drained, so a chatty progress stream cannot flood the GTK main loop.
+
+        Args:
+            message: Status message to display
+            percentage: Progress fraction, or None to pulse
+        """
+        last_message, last_percentage = self._last_status
+        if (message == last_message and percentage is not None
+                and last_percentage is not None
+                and abs(percentage - last_percentage)
+                < STATUS_PERCENTAGE_STEP):
+            return
+        self._last_status = (message, percentage)
+
+        with self._status_lock:
+            schedule = self._pending_status is None
+            self._pending_status = (message, percentage)
+
+        if schedule:
+            GLib.idle_add(self._drain_status)
+
+    def _report_progress(self, message: str,
+                         percentage: Optional[float] = None) -> bool:
+        """
+        Progress callback for API operations
+
+        Args:
+            message: Status message to display
+            percentage: Progress fraction, or None to pulse
+
+        Returns:
+            False if cancellation was requested, True to continue
+        """
+        if self._cancel_requested:
+            return False
+        self._post_status(message, percentage)
+        return True
+
+    def _run_api_worker(self, api_key: str, model_name: Optional[str],
+                        api_call: Callable[[ReplicateAPI], ApiResult],
+                        unexpected_error_text: str,
+                        result_handler: Callable, *handler_args: Any) -> None:
+        """
+        Run an API request in the background thread and hand the result
+        to the main thread
+
+        Args:
+            api_key: Replicate API key
+            model_name: Optional model name to use
+            api_call: Performs the request with the given API client and
+                returns (pixbufs, error_message)
+            unexpected_error_text: Message template with an {error}
+                placeholder for unexpected exceptions
+            result_handler: Main-thread handler called with the pixbufs
+            *handler_args: Extra arguments passed to result_handler
+        """
+        try:
+            if self._cancel_requested:
+                GLib.idle_add(self._handle_cancelled)
+                return
+
+            api = ReplicateAPI(api_key, model_name)
+            pixbufs, error_msg = api_call(api)
+
+            if self._cancel_requested:
+                GLib.idle_add(self._handle_cancelled)
+                return
+
+            if error_msg:
+                GLib.idle_add(self._handle_error, error_msg)
+                return
+
+            if not pixbufs:
+                GLib.idle_add(
+                    self._handle_error, _("No image data received from API")
+                )
+                return
+
+            GLib.idle_add(result_handler, pixbufs, *handler_args)
+
+        except (ImportError, ValueError) as e:
+            GLib.idle_add(self._handle_error, str(e))
+        except Exception as e:
+            error_msg = unexpected_error_text.format(error=str(e))
+            GLib.idle_add(self._handle_error, error_msg)
+
+    def _run_worker(self) -> None:
+        """
+        Run queued jobs on the persistent worker thread until shut down
+
+        A job that raises is reported as an error and the loop keeps
+        running, so later jobs are not left queued with nothing to run them.
+        """
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            target, args = job
+            try:
+                target(*args)
+            except Exception as e:
+                error_msg = _("Unexpected error: {error}").format(error=str(e))
+                GLib.idle_add(self._handle_error, error_msg)
+
+    def _submit(self, target: Callable, *args: Any) -> None:
+        """
+        Queue a job for the background worker, starting it on first use
+
+        Args:
+            target: Worker method to run
+            *args: Arguments passed to target
+        """
+        if not self._worker:
+            self._worker = threading.Thread(
+                target=self._run_worker, name="dream-prompter-worker",
+                daemon=True
+            )
+            self._worker.start()
+        self._jobs.put((target, args))
+
+    def _try_begin_processing(self) -> bool:
+        """
+        Atomically claim the processing slot
+
+        Returns:
+            True if this caller may start a job, False if one is running
+        """
+        with self._state_lock:
+            if self._processing:
+                return False
+            self._processing = True
+            self._cancel_requested = False
+            self._last_status = (None, None)
+            return True
@@ -8,6 +8,7 @@ Internationalization support for Dream Prompter plugin
 import gettext
 import locale
 import os
+from functools import lru_cache
 from typing import Callable
 
 DOMAIN = "dream-prompter"
@@ -50,4 +51,4 @@ def setup_i18n() -> Callable[[str], str]:
         return fallback_gettext
 
 
-_: Callable[[str], str] = setup_i18n()
+_: Callable[[str], str] = lru_cache(maxsize=512)(setup_i18n())
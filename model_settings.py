@@ -6,7 +6,7 @@ Model settings utility functions for Dream Prompter plugin
 Provides easy access to model parameter management
 """
 
-from typing import Dict, Any, List, Optional, Tuple, cast
+from typing import Dict, Any, List, Optional, Sequence, Tuple, cast
 from models import BaseModel, ParameterDefinition, ParameterType
 from models.factory import get_model_by_name, get_all_models
 from settings import get_model_settings, set_model_parameter
@@ -31,10 +31,8 @@ class ModelParameterManager:
 
     def get_all_parameter_values(self) -> Dict[str, Any]:
         """Get current values for all parameters"""
-        values = {}
-        for param_def in self.get_parameter_definitions():
-            values[param_def.name] = self.get_parameter_value(param_def.name)
-        return values
+        user_settings = get_model_settings(self.model_name)
+        return self.model.build_parameters_dict(user_settings)
 
     def get_all_parameters_info(self) -> List[Dict[str, Any]]:
         """Get complete information for all parameters"""
@@ -45,7 +43,7 @@ class ModelParameterManager:
                 info_list.append(info)
         return info_list
 
-    def get_parameter_definitions(self) -> List[ParameterDefinition]:
+    def get_parameter_definitions(self) -> Sequence[ParameterDefinition]:
         """Get all parameter definitions for this model"""
         return self.model.get_parameter_definitions()
 
@@ -162,10 +160,7 @@ class ModelParameterManager:
         self, parameter_name: str
     ) -> Optional[ParameterDefinition]:
         """Get parameter definition by name"""
-        for param_def in self.get_parameter_definitions():
-            if param_def.name == parameter_name:
-                return param_def
-        return None
+        return self.model.get_parameter_definition(parameter_name)
 
 
 def export_model_settings(model_name: str) -> Dict[str, Any]:
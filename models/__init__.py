@@ -6,10 +6,12 @@ Model classes for Dream Prompter plugin
 Defines interfaces and implementations for different AI models
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+import sys
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from enum import Enum
 
+_TRUE_STRINGS = frozenset(('true', '1', 'yes', 'on'))
+
 
 class ModelCapability(Enum):
     """Model capabilities for different operations"""
@@ -32,6 +34,12 @@ class ParameterMode(Enum):
     BOTH = "both"
 
 
+_PARAMETER_MODES = {
+    "edit": ParameterMode.EDIT,
+    "generate": ParameterMode.GENERATE,
+}
+
+
 class ParameterType(Enum):
     """Types of configurable parameters"""
     INTEGER = "integer"
@@ -45,6 +53,12 @@ class ParameterType(Enum):
 class ParameterDefinition:
     """Definition of a configurable parameter"""
 
+    __slots__ = (
+        'name', 'param_type', 'default_value', 'label', 'description',
+        'choices', 'min_value', 'max_value', 'step', 'supported_modes',
+        '_choice_set',
+    )
+
     def __init__(
         self,
         name: str,
@@ -52,7 +66,7 @@ class ParameterDefinition:
         default_value: Any,
         label: Optional[str] = None,
         description: Optional[str] = None,
-        choices: Optional[List[Any]] = None,
+        choices: Optional[Sequence[Any]] = None,
         min_value: Any = None,
         max_value: Any = None,
         step: Any = None,
@@ -63,7 +77,8 @@ class ParameterDefinition:
         self.default_value = default_value
         self.label = label or name
         self.description = description or ""
-        self.choices = choices or []
+        self.choices = choices or ()
+        self._choice_set = frozenset(self.choices)
         self.min_value = min_value
         self.max_value = max_value
         self.step = step
@@ -77,14 +92,8 @@ class ParameterDefinition:
         if ParameterMode.BOTH in self.supported_modes:
             return True
 
-        if mode == "generate":
-            mode_enum = ParameterMode.GENERATE
-        elif mode == "edit":
-            mode_enum = ParameterMode.EDIT
-        else:
-            return False
-
-        return mode_enum in self.supported_modes
+        mode_enum = _PARAMETER_MODES.get(mode)
+        return mode_enum is not None and mode_enum in self.supported_modes
 
     def validate_value(self, value: Any) -> Any:
         """Validate and convert a value for this parameter"""
@@ -106,16 +115,19 @@ class ParameterDefinition:
 
     def _validate_boolean(self, value: Any) -> bool:
         """Validate boolean parameter value"""
-        if isinstance(value, bool):
+        if value is True or value is False:
             return value
         if isinstance(value, str):
-            return value.lower() in ('true', '1', 'yes', 'on')
+            return value.lower() in _TRUE_STRINGS
         return bool(value)
 
     def _validate_choice(self, value: Any) -> Any:
         """Validate choice parameter value"""
-        if value in self.choices:
-            return value
+        try:
+            if value in self._choice_set:
+                return value
+        except TypeError:
+            pass
         return self.default_value
 
     def _validate_float(self, value: Any) -> float:
@@ -143,11 +155,20 @@ class ParameterDefinition:
             return self.default_value
 
 
-class BaseModel(ABC):
-    """Abstract base class for all AI models"""
+_EDITING_CAPABILITIES = frozenset((ModelCapability.EDIT, ModelCapability.BOTH))
+_GENERATION_CAPABILITIES = frozenset(
+    (ModelCapability.GENERATE, ModelCapability.BOTH)
+)
+
+
+class BaseModel:
+    """Base class for all AI models"""
+
+    # Built on first lookup; a class default so subclasses with their own
+    # __init__ need not call super().__init__()
+    _parameter_index: Optional[Dict[str, ParameterDefinition]] = None
 
     @property
-    @abstractmethod
     def capabilities(self) -> ModelCapability:
         """
         Get model capabilities (default: both generate and edit)
@@ -156,34 +177,29 @@ class BaseModel(ABC):
         return ModelCapability.BOTH
 
     @property
-    @abstractmethod
     def default_output_format(self) -> OutputFormat:
         """Default output format for generated images"""
-        pass
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def description(self) -> str:
         """Model description"""
-        pass
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def display_name(self) -> str:
         """Human-readable model name"""
-        pass
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def max_file_size_mb(self) -> int:
         """Maximum file size in MB for reference images"""
-        pass
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def max_reference_images(self) -> int:
         """Maximum number of reference images for generation"""
-        pass
+        raise NotImplementedError
 
     @property
     def max_reference_images_edit(self) -> int:
@@ -191,18 +207,15 @@ class BaseModel(ABC):
         return max(1, self.max_reference_images - 1)
 
     @property
-    @abstractmethod
     def name(self) -> str:
         """Model name/identifier"""
-        pass
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def supported_mime_types(self) -> List[str]:
         """List of supported MIME types for reference images"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def build_edit_input(
         self,
         prompt: str,
@@ -225,9 +238,8 @@ class BaseModel(ABC):
         Returns:
             Dictionary of input parameters for the model API
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def build_generation_input(
         self,
         prompt: str,
@@ -248,26 +260,34 @@ class BaseModel(ABC):
         Returns:
             Dictionary of input parameters for the model API
         """
-        pass
+        raise NotImplementedError
 
     def build_parameters_dict(self,
-                              user_settings: Optional[Dict[str, Any]] = None
+                              user_settings: Optional[Dict[str, Any]] = None,
+                              overrides: Optional[Dict[str, Any]] = None
                               ) -> Dict[str, Any]:
         """
         Build dictionary of all parameter values for API calls
 
         Args:
             user_settings: User's saved settings for this model
+            overrides: Values that replace the resolved value of known
+                parameters as-is (unknown keys are ignored)
 
         Returns:
             Dictionary of parameter name -> value
         """
+        user_settings = user_settings or {}
+        overrides = overrides or {}
         params = {}
         for param_def in self.get_parameter_definitions():
-            param_value = self.get_parameter_value(
-                param_def.name, user_settings
-            )
-            params[param_def.name] = param_value
+            name = param_def.name
+            if name in overrides:
+                params[name] = overrides[name]
+            elif name in user_settings:
+                params[name] = param_def.validate_value(user_settings[name])
+            else:
+                params[name] = param_def.default_value
         return params
 
     def get_output_format_string(self, format_enum: OutputFormat) -> str:
@@ -282,14 +302,32 @@ class BaseModel(ABC):
         """
         return format_enum.value
 
-    def get_parameter_definitions(self) -> List[ParameterDefinition]:
+    def get_parameter_definition(self, parameter_name: str
+                                 ) -> Optional[ParameterDefinition]:
         """
-        Get list of configurable parameters for this model
+        Get a parameter definition by name
+
+        Args:
+            parameter_name: Name of the parameter
 
         Returns:
-            List of ParameterDefinition objects
+            ParameterDefinition, or None if the model has no such parameter
         """
-        return []
+        if self._parameter_index is None:
+            self._parameter_index = {
+                param_def.name: param_def
+                for param_def in self.get_parameter_definitions()
+            }
+        return self._parameter_index.get(parameter_name)
+
+    def get_parameter_definitions(self) -> Sequence[ParameterDefinition]:
+        """
+        Get the configurable parameters for this model
+
+        Returns:
+            Read-only sequence of ParameterDefinition objects
+        """
+        return ()
 
     def get_parameter_value(
         self,
@@ -306,7 +344,7 @@ class BaseModel(ABC):
         Returns:
             Parameter value (validated and converted)
         """
-        param_def = self._get_parameter_definition(parameter_name)
+        param_def = self.get_parameter_definition(parameter_name)
         if not param_def:
             return None
 
@@ -325,11 +363,11 @@ class BaseModel(ABC):
 
     def supports_generation(self) -> bool:
         """Check if model supports image generation"""
-        return self.capabilities in [ModelCapability.GENERATE, ModelCapability.BOTH]
+        return self.capabilities in _GENERATION_CAPABILITIES
 
     def supports_editing(self) -> bool:
         """Check if model supports image editing"""
-        return self.capabilities in [ModelCapability.EDIT, ModelCapability.BOTH]
+        return self.capabilities in _EDITING_CAPABILITIES
 
     def validate_file_size(self, size_bytes: int) -> bool:
         """
@@ -356,21 +394,15 @@ class BaseModel(ABC):
         """
         return mime_type in self.supported_mime_types
 
-    def _get_parameter_definition(self, parameter_name: str
-                                  ) -> Optional[ParameterDefinition]:
-        """Get parameter definition by name"""
-        for param_def in self.get_parameter_definitions():
-            if param_def.name == parameter_name:
-                return param_def
-        return None
-
 
 _model_registry: Dict[str, BaseModel] = {}
+_model_options_cache: Dict[bool, Tuple[Tuple[str, str], ...]] = {}
 
 
 def register_model(model: BaseModel) -> None:
     """Register a model in the global registry"""
-    _model_registry[model.name] = model
+    _model_registry[sys.intern(model.name)] = model
+    _model_options_cache.clear()
 
 
 def get_model(name: str) -> Optional[BaseModel]:
@@ -425,3 +457,30 @@ def get_models_for_context(has_image: bool = False) -> Dict[str, BaseModel]:
 def get_model_names() -> List[str]:
     """Get list of all registered model names"""
     return list(_model_registry.keys())
+
+
+def get_model_options(has_image: bool = False
+                      ) -> Tuple[Tuple[str, str], ...]:
+    """
+    Get (name, display name) pairs of the models usable in a context
+
+    The pairs are sorted by display name. They are computed once per
+    context and recomputed after a model is registered.
+
+    Args:
+        has_image: Whether an image is currently open in GIMP
+
+    Returns:
+        Tuple of (model name, display name) pairs
+    """
+    options = _model_options_cache.get(has_image)
+    if options is None:
+        options = tuple(sorted(
+            ((name, model.display_name)
+             for name, model in _model_registry.items()
+             if model.supports_generation()
+             or (has_image and model.supports_editing())),
+            key=lambda option: option[1]
+        ))
+        _model_options_cache[has_image] = options
+    return options
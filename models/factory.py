@@ -6,14 +6,25 @@ Model factory for Dream Prompter plugin
 Provides easy access to model instances and management
 """
 
-from typing import Optional, Dict
-from . import BaseModel, get_model, get_all_models
-
-# Import models to register them
-from . import imagen4  # noqa: F401
-from . import nano_banana  # noqa: F401
-from . import qwen_image_edit_plus  # noqa: F401
-from . import seedream4  # noqa: F401
+from typing import Optional, Dict, Tuple
+from . import (BaseModel, get_model, get_all_models, get_model_options,
+               register_model)
+from . import get_compatible_models as _get_compatible_models
+from . import get_models_for_context as _get_models_for_context
+from .imagen4 import Imagen4Model
+from .nano_banana import NanaBananaModel
+from .qwen_image_edit_plus import QwenImageEditModel
+from .seedream4 import Seedream4Model
+
+MODEL_CLASSES = (
+    Imagen4Model,
+    NanaBananaModel,
+    QwenImageEditModel,
+    Seedream4Model,
+)
+
+for model_class in MODEL_CLASSES:
+    register_model(model_class())
 
 
 class ModelFactory:
@@ -42,9 +53,7 @@ class ModelFactory:
         Returns:
             Dictionary of compatible models
         """
-        all_models = self.get_available_models()
-        return {name: model for name, model in all_models.items()
-                if model.is_mode_supported(mode)}
+        return _get_compatible_models(mode)
 
     def get_default_model(self) -> BaseModel:
         """
@@ -63,6 +72,19 @@ class ModelFactory:
             )
         return model
 
+    def get_model_options(self, has_image: bool = False
+                          ) -> Tuple[Tuple[str, str], ...]:
+        """
+        Get sorted (name, display name) pairs for the current context
+
+        Args:
+            has_image: Whether an image is currently open in GIMP
+
+        Returns:
+            Tuple of (model name, display name) pairs
+        """
+        return get_model_options(has_image)
+
     def get_models_for_context(self, has_image: bool = False) -> Dict[str, BaseModel]:
         """
         Get models appropriate for the current context
@@ -73,18 +95,7 @@ class ModelFactory:
         Returns:
             Dictionary of model name -> model instance filtered by context
         """
-        all_models = self.get_available_models()
-        filtered_models = {}
-
-        for name, model in all_models.items():
-            if has_image:
-                if model.supports_editing() or model.supports_generation():
-                    filtered_models[name] = model
-            else:
-                if model.supports_generation():
-                    filtered_models[name] = model
-
-        return filtered_models
+        return _get_models_for_context(has_image)
 
     def get_model_by_name(self, name: str) -> Optional[BaseModel]:
         """
@@ -112,6 +123,12 @@ def get_default_model() -> BaseModel:
     return model_factory.get_default_model()
 
 
+def get_model_options_for_context(has_image: bool = False
+                                  ) -> Tuple[Tuple[str, str], ...]:
+    """Convenience function to get dropdown options for context"""
+    return model_factory.get_model_options(has_image)
+
+
 def get_models_for_context(has_image: bool = False) -> Dict[str, BaseModel]:
     """Convenience function to get models for context"""
     return model_factory.get_models_for_context(has_image)
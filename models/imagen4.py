@@ -6,7 +6,7 @@ Imagen 4 model implementation
 Available through Replicate API
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 
 from . import (
     BaseModel,
@@ -15,10 +15,47 @@ from . import (
     ParameterDefinition,
     ParameterType,
     ParameterMode,
-    register_model,
 )
 from i18n import _
 
+ASPECT_RATIO_CHOICES = ("1:1", "9:16", "16:9", "3:4", "4:3")
+OUTPUT_FORMAT_CHOICES = ("png", "jpg")
+SAFETY_FILTER_LEVEL_CHOICES = (
+    "block_low_and_above",
+    "block_medium_and_above",
+    "block_only_high",
+)
+
+PARAMETER_DEFINITIONS = (
+    ParameterDefinition(
+        name="aspect_ratio",
+        param_type=ParameterType.CHOICE,
+        default_value="1:1",
+        label=_("Aspect Ratio"),
+        description=_("Control aspect ratio of generated images"),
+        choices=ASPECT_RATIO_CHOICES,
+        supported_modes=[ParameterMode.GENERATE],
+    ),
+    ParameterDefinition(
+        name="output_format",
+        param_type=ParameterType.CHOICE,
+        default_value="png",
+        label=_("Output Format"),
+        description=_("Format for generated images"),
+        choices=OUTPUT_FORMAT_CHOICES,
+        supported_modes=[ParameterMode.GENERATE],
+    ),
+    ParameterDefinition(
+        name="safety_filter_level",
+        param_type=ParameterType.CHOICE,
+        default_value="block_only_high",
+        label=_("Safety Filter Level"),
+        description=_("Control safety of generated images"),
+        choices=SAFETY_FILTER_LEVEL_CHOICES,
+        supported_modes=[ParameterMode.GENERATE],
+    ),
+)
+
 
 class Imagen4Model(BaseModel):
     """Google's Imagen 4 model implementation for Replicate"""
@@ -111,11 +148,7 @@ class Imagen4Model(BaseModel):
         Returns:
             Dictionary of input parameters for the Replicate API
         """
-        params = self.build_parameters_dict(user_settings or {})
-
-        for key, value in kwargs.items():
-            if key in params:
-                params[key] = value
+        params = self.build_parameters_dict(user_settings, kwargs)
 
         default_format = self.get_output_format_string(self.default_output_format)
         output_format = params.get("output_format", default_format)
@@ -131,42 +164,6 @@ class Imagen4Model(BaseModel):
 
         return model_input
 
-    def get_parameter_definitions(self) -> List[ParameterDefinition]:
+    def get_parameter_definitions(self) -> Sequence[ParameterDefinition]:
         """Get list of configurable parameters for Imagen 4"""
-        return [
-            ParameterDefinition(
-                name="aspect_ratio",
-                param_type=ParameterType.CHOICE,
-                default_value="1:1",
-                label=_("Aspect Ratio"),
-                description=_("Control aspect ratio of generated images"),
-                choices=["1:1", "9:16", "16:9", "3:4", "4:3"],
-                supported_modes=[ParameterMode.GENERATE],
-            ),
-            ParameterDefinition(
-                name="output_format",
-                param_type=ParameterType.CHOICE,
-                default_value="png",
-                label=_("Output Format"),
-                description=_("Format for generated images"),
-                choices=["png", "jpg"],
-                supported_modes=[ParameterMode.GENERATE],
-            ),
-            ParameterDefinition(
-                name="safety_filter_level",
-                param_type=ParameterType.CHOICE,
-                default_value="block_only_high",
-                label=_("Safety Filter Level"),
-                description=_("Control safety of generated images"),
-                choices=[
-                    "block_low_and_above",
-                    "block_medium_and_above",
-                    "block_only_high",
-                ],
-                supported_modes=[ParameterMode.GENERATE],
-            ),
-        ]
-
-
-imagen4 = Imagen4Model()
-register_model(imagen4)
+        return PARAMETER_DEFINITIONS
@@ -7,12 +7,26 @@ Available through Replicate API
 """
 
 import io
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 
 from . import (BaseModel, ModelCapability, OutputFormat, ParameterDefinition,
-               ParameterType, ParameterMode, register_model)
+               ParameterType, ParameterMode)
 from i18n import _
 
+OUTPUT_FORMAT_CHOICES = ("png", "jpg")
+
+PARAMETER_DEFINITIONS = (
+    ParameterDefinition(
+        name="output_format",
+        param_type=ParameterType.CHOICE,
+        default_value="png",
+        label=_("Output Format"),
+        description=_("Format for generated images"),
+        choices=OUTPUT_FORMAT_CHOICES,
+        supported_modes=[ParameterMode.BOTH]
+    ),
+)
+
 
 class NanaBananaModel(BaseModel):
     """Google's Nano Banana model implementation for Replicate"""
@@ -89,11 +103,7 @@ class NanaBananaModel(BaseModel):
         if reference_images:
             image_input.extend(reference_images)
 
-        params = self.build_parameters_dict(user_settings or {})
-
-        for key, value in kwargs.items():
-            if key in params:
-                params[key] = value
+        params = self.build_parameters_dict(user_settings, kwargs)
 
         default_format = self.get_output_format_string(
             self.default_output_format
@@ -123,11 +133,7 @@ class NanaBananaModel(BaseModel):
         Returns:
             Dictionary of input parameters for the Replicate API
         """
-        params = self.build_parameters_dict(user_settings or {})
-
-        for key, value in kwargs.items():
-            if key in params:
-                params[key] = value
+        params = self.build_parameters_dict(user_settings, kwargs)
 
         default_format = self.get_output_format_string(
             self.default_output_format
@@ -141,20 +147,6 @@ class NanaBananaModel(BaseModel):
 
         return model_input
 
-    def get_parameter_definitions(self) -> List[ParameterDefinition]:
+    def get_parameter_definitions(self) -> Sequence[ParameterDefinition]:
         """Get list of configurable parameters for Nano Banana"""
-        return [
-            ParameterDefinition(
-                name="output_format",
-                param_type=ParameterType.CHOICE,
-                default_value="png",
-                label=_("Output Format"),
-                description=_("Format for generated images"),
-                choices=["png", "jpg"],
-                supported_modes=[ParameterMode.BOTH]
-            )
-        ]
-
-
-nano_banana = NanaBananaModel()
-register_model(nano_banana)
+        return PARAMETER_DEFINITIONS
@@ -8,7 +8,7 @@ Available through Replicate API
 """
 
 import io
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 
 from . import (
     BaseModel,
@@ -17,10 +17,71 @@ from . import (
     ParameterDefinition,
     ParameterType,
     ParameterMode,
-    register_model,
 )
 from i18n import _
 
+ASPECT_RATIO_CHOICES = (
+    "match_input_image", "1:1", "4:3", "3:4", "16:9", "9:16",
+)
+OUTPUT_FORMAT_CHOICES = ("jpg", "png", "webp")
+
+PARAMETER_DEFINITIONS = (
+    ParameterDefinition(
+        name="aspect_ratio",
+        param_type=ParameterType.CHOICE,
+        default_value="match_input_image",
+        label=_("Aspect Ratio"),
+        description=_("Control aspect ratio of generated images"),
+        choices=ASPECT_RATIO_CHOICES,
+        supported_modes=[ParameterMode.GENERATE],
+    ),
+    ParameterDefinition(
+        name="go_fast",
+        param_type=ParameterType.BOOLEAN,
+        default_value=True,
+        label=_("Go Fast"),
+        description=_("Enable speed optimizations"),
+        supported_modes=[ParameterMode.BOTH],
+    ),
+    ParameterDefinition(
+        name="seed",
+        param_type=ParameterType.INTEGER,
+        default_value=0,
+        label=_("Seed"),
+        description=_("Random seed for reproducible results (0 = random)"),
+        min_value=0,
+        max_value=999999999,
+        supported_modes=[ParameterMode.BOTH],
+    ),
+    ParameterDefinition(
+        name="output_format",
+        param_type=ParameterType.CHOICE,
+        default_value="png",
+        label=_("Output Format"),
+        description=_("Output image format"),
+        choices=OUTPUT_FORMAT_CHOICES,
+        supported_modes=[ParameterMode.BOTH],
+    ),
+    ParameterDefinition(
+        name="output_quality",
+        param_type=ParameterType.INTEGER,
+        default_value=95,
+        label=_("Output Quality"),
+        description=_("JPEG quality (0-100, ignored for PNG)"),
+        min_value=0,
+        max_value=100,
+        supported_modes=[ParameterMode.BOTH],
+    ),
+    ParameterDefinition(
+        name="disable_safety_checker",
+        param_type=ParameterType.BOOLEAN,
+        default_value=True,
+        label=_("Disable Safety Checker"),
+        description=_("Bypass safety checks"),
+        supported_modes=[ParameterMode.BOTH],
+    ),
+)
+
 
 class QwenImageEditModel(BaseModel):
     """Qwen Image Edit Plus model implementation for Replicate"""
@@ -100,11 +161,7 @@ class QwenImageEditModel(BaseModel):
                 reference_images[:self.max_reference_images_edit]
             )
 
-        params = self.build_parameters_dict(user_settings or {})
-
-        for key, value in kwargs.items():
-            if key in params:
-                params[key] = value
+        params = self.build_parameters_dict(user_settings, kwargs)
 
         model_input = {
             "prompt": prompt,
@@ -145,65 +202,6 @@ class QwenImageEditModel(BaseModel):
 
         return {}
 
-    def get_parameter_definitions(self) -> List[ParameterDefinition]:
+    def get_parameter_definitions(self) -> Sequence[ParameterDefinition]:
         """Get list of configurable parameters for Qwen Image Edit Plus"""
-        return [
-            ParameterDefinition(
-                name="aspect_ratio",
-                param_type=ParameterType.CHOICE,
-                default_value="match_input_image",
-                label=_("Aspect Ratio"),
-                description=_("Control aspect ratio of generated images"),
-                choices=["match_input_image", "1:1", "4:3", "3:4", "16:9", "9:16"],
-                supported_modes=[ParameterMode.GENERATE],
-            ),
-            ParameterDefinition(
-                name="go_fast",
-                param_type=ParameterType.BOOLEAN,
-                default_value=True,
-                label=_("Go Fast"),
-                description=_("Enable speed optimizations"),
-                supported_modes=[ParameterMode.BOTH],
-            ),
-            ParameterDefinition(
-                name="seed",
-                param_type=ParameterType.INTEGER,
-                default_value=0,
-                label=_("Seed"),
-                description=_("Random seed for reproducible results (0 = random)"),
-                min_value=0,
-                max_value=999999999,
-                supported_modes=[ParameterMode.BOTH],
-            ),
-            ParameterDefinition(
-                name="output_format",
-                param_type=ParameterType.CHOICE,
-                default_value="png",
-                label=_("Output Format"),
-                description=_("Output image format"),
-                choices=["jpg", "png", "webp"],
-                supported_modes=[ParameterMode.BOTH],
-            ),
-            ParameterDefinition(
-                name="output_quality",
-                param_type=ParameterType.INTEGER,
-                default_value=95,
-                label=_("Output Quality"),
-                description=_("JPEG quality (0-100, ignored for PNG)"),
-                min_value=0,
-                max_value=100,
-                supported_modes=[ParameterMode.BOTH],
-            ),
-            ParameterDefinition(
-                name="disable_safety_checker",
-                param_type=ParameterType.BOOLEAN,
-                default_value=True,
-                label=_("Disable Safety Checker"),
-                description=_("Bypass safety checks"),
-                supported_modes=[ParameterMode.BOTH],
-            ),
-        ]
-
-
-qwen_image_edit = QwenImageEditModel()
-register_model(qwen_image_edit)
+        return PARAMETER_DEFINITIONS
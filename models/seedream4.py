@@ -8,12 +8,79 @@ Available through Replicate API
 """
 
 import io
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 
 from . import (BaseModel, ModelCapability, OutputFormat, ParameterDefinition,
-               ParameterType, ParameterMode, register_model)
+               ParameterType, ParameterMode)
 from i18n import _
 
+ASPECT_RATIO_CHOICES = ("match_input_image", "1:1", "4:3", "3:4", "16:9",
+                        "9:16", "3:2", "2:3", "21.9")
+SEQUENTIAL_GENERATION_CHOICES = ("disabled", "auto")
+SIZE_CHOICES = ("1K", "2K", "4K", "custom")
+
+PARAMETER_DEFINITIONS = (
+    ParameterDefinition(
+        name="size",
+        param_type=ParameterType.CHOICE,
+        default_value="2K",
+        label=_("Image Size"),
+        description=_("Resolution preset for generated images"),
+        choices=SIZE_CHOICES,
+        supported_modes=[ParameterMode.BOTH]
+    ),
+    ParameterDefinition(
+        name="width",
+        param_type=ParameterType.INTEGER,
+        default_value=2048,
+        label=_("Width"),
+        description=_("Custom width in pixels"),
+        min_value=1024,
+        max_value=4096,
+        step=1,
+        supported_modes=[ParameterMode.BOTH]
+    ),
+    ParameterDefinition(
+        name="height",
+        param_type=ParameterType.INTEGER,
+        default_value=2048,
+        label=_("Height"),
+        description=_("Custom height in pixels"),
+        min_value=1024,
+        max_value=4096,
+        step=1,
+        supported_modes=[ParameterMode.BOTH]
+    ),
+    ParameterDefinition(
+        name="aspect_ratio",
+        param_type=ParameterType.CHOICE,
+        default_value="match_input_image",
+        label=_("Aspect Ratio"),
+        description=_("Control aspect ratio of generated images"),
+        choices=ASPECT_RATIO_CHOICES,
+        supported_modes=[ParameterMode.GENERATE]
+    ),
+    ParameterDefinition(
+        name="max_images",
+        param_type=ParameterType.INTEGER,
+        default_value=1,
+        label=_("Max Images"),
+        description=_("Maximum number of images to generate"),
+        min_value=1,
+        max_value=15,
+        supported_modes=[ParameterMode.BOTH]
+    ),
+    ParameterDefinition(
+        name="sequential_image_generation",
+        param_type=ParameterType.CHOICE,
+        default_value="disabled",
+        label=_("Sequential Generation"),
+        description=_("Generate images sequentially or in parallel"),
+        choices=SEQUENTIAL_GENERATION_CHOICES,
+        supported_modes=[ParameterMode.BOTH]
+    ),
+)
+
 
 class Seedream4Model(BaseModel):
     """ByteDance Seedream 4 model implementation for Replicate"""
@@ -94,11 +161,7 @@ class Seedream4Model(BaseModel):
                 reference_images[:self.max_reference_images_edit]
             )
 
-        params = self.build_parameters_dict(user_settings or {})
-
-        for key, value in kwargs.items():
-            if key in params:
-                params[key] = value
+        params = self.build_parameters_dict(user_settings, kwargs)
 
         model_input = {
             "prompt": prompt,
@@ -133,11 +196,7 @@ class Seedream4Model(BaseModel):
         Returns:
             Dictionary of input parameters for the Replicate API
         """
-        params = self.build_parameters_dict(user_settings or {})
-
-        for key, value in kwargs.items():
-            if key in params:
-                params[key] = value
+        params = self.build_parameters_dict(user_settings, kwargs)
 
         model_input = {
             "prompt": prompt,
@@ -154,71 +213,6 @@ class Seedream4Model(BaseModel):
 
         return {k: v for k, v in model_input.items() if v is not None}
 
-    def get_parameter_definitions(self) -> List[ParameterDefinition]:
+    def get_parameter_definitions(self) -> Sequence[ParameterDefinition]:
         """Get list of configurable parameters for Seedream 4"""
-        return [
-            ParameterDefinition(
-                name="size",
-                param_type=ParameterType.CHOICE,
-                default_value="2K",
-                label=_("Image Size"),
-                description=_("Resolution preset for generated images"),
-                choices=["1K", "2K", "4K", "custom"],
-                supported_modes=[ParameterMode.BOTH]
-            ),
-            ParameterDefinition(
-                name="width",
-                param_type=ParameterType.INTEGER,
-                default_value=2048,
-                label=_("Width"),
-                description=_("Custom width in pixels"),
-                min_value=1024,
-                max_value=4096,
-                step=1,
-                supported_modes=[ParameterMode.BOTH]
-            ),
-            ParameterDefinition(
-                name="height",
-                param_type=ParameterType.INTEGER,
-                default_value=2048,
-                label=_("Height"),
-                description=_("Custom height in pixels"),
-                min_value=1024,
-                max_value=4096,
-                step=1,
-                supported_modes=[ParameterMode.BOTH]
-            ),
-            ParameterDefinition(
-                name="aspect_ratio",
-                param_type=ParameterType.CHOICE,
-                default_value="match_input_image",
-                label=_("Aspect Ratio"),
-                description=_("Control aspect ratio of generated images"),
-                choices=["match_input_image", "1:1", "4:3", "3:4", "16:9",
-                         "9:16", "3:2", "2:3", "21.9"],
-                supported_modes=[ParameterMode.GENERATE]
-            ),
-            ParameterDefinition(
-                name="max_images",
-                param_type=ParameterType.INTEGER,
-                default_value=1,
-                label=_("Max Images"),
-                description=_("Maximum number of images to generate"),
-                min_value=1,
-                max_value=15,
-                supported_modes=[ParameterMode.BOTH]
-            ),
-            ParameterDefinition(
-                name="sequential_image_generation",
-                param_type=ParameterType.CHOICE,
-                default_value="disabled",
-                label=_("Sequential Generation"),
-                description=_("Generate images sequentially or in parallel"),
-                choices=["disabled", "auto"],
-                supported_modes=[ParameterMode.BOTH]
-            )
-        ]
-
-
-seedream4 = Seedream4Model()
-register_model(seedream4)
+        return PARAMETER_DEFINITIONS
@@ -5,10 +5,11 @@
 Settings management for Dream Prompter plugin
 """
 
+import copy
 import json
 import os
 import platform
-from typing import cast, Dict, Union, Literal, Any, Optional
+from typing import cast, Dict, Union, Literal, Any, Optional, Tuple
 
 try:
     from models.factory import model_factory
@@ -23,8 +24,12 @@ CONFIG_FILE_NAME = "dream-prompter-config.json"
 GIMP_VERSION = "3.0"
 FILE_PERMISSIONS = 0o600
 
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+
 DEFAULT_MODE = "edit"
 DEFAULT_API_KEY_VISIBLE = False
+_VALID_MODES = frozenset(("edit", "generate"))
 
 DEFAULT_SETTINGS: SettingsDict = {
     "api_key": "",
@@ -35,24 +40,27 @@ DEFAULT_SETTINGS: SettingsDict = {
     "model_settings": {}
 }
 
+_config_file: Optional[str] = None
+_config_dir_ready = False
+_settings_cache: Optional[Tuple[Tuple[int, int], SettingsDict]] = None
+
 
 def get_config_file() -> str:
     """Get path to config file in GIMP's user directory"""
-    system = platform.system()
+    global _config_file
 
-    if system == "Windows":
+    if _config_file is not None:
+        return _config_file
+
+    if _IS_WINDOWS:
         gimp_dir = _get_windows_config_dir()
-    elif system == "Darwin":
+    elif _SYSTEM == "Darwin":
         gimp_dir = _get_macos_config_dir()
     else:
         gimp_dir = _get_linux_config_dir()
 
-    try:
-        os.makedirs(gimp_dir, exist_ok=True)
-    except (OSError, PermissionError) as e:
-        print(f"Warning: Could not create config directory {gimp_dir}: {e}")
-
-    return os.path.join(gimp_dir, CONFIG_FILE_NAME)
+    _config_file = os.path.join(gimp_dir, CONFIG_FILE_NAME)
+    return _config_file
 
 
 def get_default_model_name() -> str:
@@ -101,20 +109,33 @@ def get_model_settings(model_name: str) -> ModelSettingsDict:
 
 
 def load_settings() -> SettingsDict:
-    """Load settings from config file"""
-    try:
-        config_file = get_config_file()
-        if os.path.exists(config_file):
-            with open(config_file, 'r', encoding='utf-8') as f:
-                loaded_settings = cast(SettingsDict, json.load(f))
-                for key, default_value in DEFAULT_SETTINGS.items():
-                    if key not in loaded_settings:
-                        loaded_settings[key] = default_value
+    """
+    Load settings from config file
 
-                if not loaded_settings.get("model"):
-                    loaded_settings["model"] = get_default_model_name()
+    The parsed settings are cached in memory and reused until the file's
+    modification time or size changes. Callers always get their own copy.
+    """
+    global _settings_cache
 
-                return loaded_settings
+    try:
+        config_file = get_config_file()
+        signature = _get_file_signature(config_file)
+        if _settings_cache and _settings_cache[0] == signature:
+            return copy.deepcopy(_settings_cache[1])
+
+        with open(config_file, 'r', encoding='utf-8') as f:
+            loaded_settings = cast(SettingsDict, json.load(f))
+            for key, default_value in DEFAULT_SETTINGS.items():
+                if key not in loaded_settings:
+                    loaded_settings[key] = copy.deepcopy(default_value)
+
+            if not loaded_settings.get("model"):
+                loaded_settings["model"] = get_default_model_name()
+
+            _settings_cache = (signature, copy.deepcopy(loaded_settings))
+            return loaded_settings
+    except FileNotFoundError:
+        pass
     except (OSError, PermissionError) as e:
         print(f"Failed to read settings file: {e}")
     except json.JSONDecodeError as e:
@@ -122,7 +143,7 @@ def load_settings() -> SettingsDict:
     except Exception as e:
         print(f"Unexpected error loading settings: {e}")
 
-    return DEFAULT_SETTINGS.copy()
+    return copy.deepcopy(DEFAULT_SETTINGS)
 
 
 def set_model_parameter(model_name: str, parameter: str, value: Any) -> None:
@@ -150,24 +171,22 @@ def store_model_settings(model_name: str,
     """
     try:
         current_settings = load_settings()
-        all_model_settings = current_settings.get("model_settings", {})
-
-        if isinstance(all_model_settings, dict):
-            all_model_settings[model_name] = model_settings
-
-        store_settings(
-            api_key=str(current_settings.get("api_key", "")),
-            mode=str(current_settings.get("mode", DEFAULT_MODE)),
-            prompt=str(current_settings.get("prompt", "")),
-            api_key_visible=bool(current_settings.get(
-                "api_key_visible", DEFAULT_API_KEY_VISIBLE
-            )),
-            model=str(current_settings.get("model", "")),
-            model_settings=(
-                all_model_settings if isinstance(all_model_settings, dict)
-                else None
-            )
+        all_model_settings = current_settings.get("model_settings")
+
+        if not isinstance(all_model_settings, dict):
+            all_model_settings = {}
+        all_model_settings[model_name] = model_settings
+
+        settings = _build_settings(
+            str(current_settings.get("api_key", "")),
+            str(current_settings.get("mode", DEFAULT_MODE)),
+            str(current_settings.get("prompt", "")),
+            bool(current_settings.get("api_key_visible",
+                                      DEFAULT_API_KEY_VISIBLE)),
+            str(current_settings.get("model", "")),
+            all_model_settings
         )
+        _write_settings(settings)
     except Exception as e:
         print(f"Error storing model settings for {model_name}: {e}")
 
@@ -181,36 +200,21 @@ def store_settings(
     model_settings: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> None:
     """Store settings to config file"""
-    if mode not in ("edit", "generate"):
+    if mode not in _VALID_MODES:
         raise ValueError(f"Invalid mode: {mode}. Must be 'edit' or 'generate'")
 
     try:
-        if not model:
-            model = get_default_model_name()
-
         existing_settings = load_settings()
         existing_model_settings = existing_settings.get("model_settings", {})
+        if not isinstance(existing_model_settings, dict):
+            existing_model_settings = {}
 
         if model_settings:
-            if isinstance(existing_model_settings, dict):
-                existing_model_settings.update(model_settings)
-
-        settings = {
-            "api_key": api_key,
-            "mode": mode,
-            "prompt": prompt,
-            "api_key_visible": api_key_visible,
-            "model": model,
-            "model_settings": existing_model_settings
-        }
-
-        config_file = get_config_file()
+            existing_model_settings.update(model_settings)
 
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=2)
-
-        if platform.system() != "Windows":
-            os.chmod(config_file, FILE_PERMISSIONS)
+        settings = _build_settings(api_key, mode, prompt, api_key_visible,
+                                   model, existing_model_settings)
+        _write_settings(settings)
 
     except (OSError, PermissionError) as e:
         print(f"Failed to store settings: {e}")
@@ -220,6 +224,57 @@ def store_settings(
         print(f"Unexpected error storing settings: {e}")
 
 
+def _build_settings(
+    api_key: str,
+    mode: str,
+    prompt: str,
+    api_key_visible: bool,
+    model: str,
+    model_settings: Dict[str, Any]
+) -> SettingsDict:
+    """
+    Build the settings dictionary that is written to the config file
+
+    Only the known keys are included, so unknown keys read from the file
+    are not written back.
+
+    Raises:
+        ValueError: If mode is not 'edit' or 'generate'
+    """
+    if mode not in _VALID_MODES:
+        raise ValueError(f"Invalid mode: {mode}. Must be 'edit' or 'generate'")
+
+    return {
+        "api_key": api_key,
+        "mode": mode,
+        "prompt": prompt,
+        "api_key_visible": api_key_visible,
+        "model": model or get_default_model_name(),
+        "model_settings": model_settings
+    }
+
+
+def _ensure_config_dir(config_file: str) -> None:
+    """Create the config directory once, before the first write"""
+    global _config_dir_ready
+
+    if _config_dir_ready:
+        return
+
+    gimp_dir = os.path.dirname(config_file)
+    try:
+        os.makedirs(gimp_dir, exist_ok=True)
+        _config_dir_ready = True
+    except (OSError, PermissionError) as e:
+        print(f"Warning: Could not create config directory {gimp_dir}: {e}")
+
+
+def _get_file_signature(path: str) -> Tuple[int, int]:
+    """Get (mtime_ns, size) of a file for settings cache validation"""
+    stat_result = os.stat(path)
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
 def _get_linux_config_dir() -> str:
     """Get Linux config directory"""
     return os.path.join(
@@ -241,3 +296,50 @@ def _get_windows_config_dir() -> str:
     if not appdata:
         appdata = os.path.expanduser("~\\AppData\\Roaming")
     return os.path.join(appdata, 'GIMP', GIMP_VERSION)
+
+
+def _write_settings(settings: SettingsDict) -> None:
+    """
+    Write a complete settings dictionary to the config file
+
+    The data is written to a temporary file next to the config, created
+    with owner-only permissions, and moved into place with os.replace,
+    so an interrupted write never leaves a truncated config behind. The
+    in-memory settings cache is refreshed with the written data, and the
+    write is skipped entirely when the file on disk already holds exactly
+    these settings.
+
+    Args:
+        settings: Settings to persist
+    """
+    global _settings_cache
+
+    config_file = get_config_file()
+    if _settings_cache and _settings_cache[1] == settings:
+        try:
+            if _get_file_signature(config_file) == _settings_cache[0]:
+                return
+        except OSError:
+            pass
+
+    _ensure_config_dir(config_file)
+    temp_file = f"{config_file}.tmp.{os.getpid()}"
+
+    try:
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                     FILE_PERMISSIONS)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(settings, f, separators=(',', ':'),
+                      ensure_ascii=False)
+
+        os.replace(temp_file, config_file)
+    except Exception:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        raise
+
+    _settings_cache = (
+        _get_file_signature(config_file), copy.deepcopy(settings)
+    )